@@ -103,6 +103,8 @@ class SatelliteApp(App):
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 stdin=subprocess.DEVNULL,
+                # Never hand the long-lived view server any of our descriptors.
+                close_fds=True,
                 start_new_session=True,
             )
         except (FileNotFoundError, OSError, subprocess.SubprocessError) as exc:
@@ -336,8 +336,11 @@ class JobListModal(ModalScreen[str | None]):
     @work(exclusive=True, thread=True)
     def _refresh_jobs_in_thread(self) -> None:
         """Fetch jobs on a worker thread to avoid blocking the event loop."""
+        # Resolve the app before the slow read: once the widget is unmounted,
+        # self.app can no longer be found from this thread.
+        app = self.app
         fresh_jobs = self._job_manager.list_jobs(limit=20)
-        self.app.call_from_thread(self._apply_job_refresh, fresh_jobs)
+        app.call_from_thread(self._apply_job_refresh, fresh_jobs)
 
     def _apply_job_refresh(self, fresh_jobs: list[Job]) -> None:
         """Apply fetched job data to the UI (must run on main thread)."""
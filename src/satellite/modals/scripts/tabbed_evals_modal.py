@@ -109,6 +109,10 @@ class JobListContent(Vertical):
             super().__init__()
             self.job_id = job_id
 
+    # Fast polling yields a "per-sample" feel without requiring an active
+    # inspect trace viewer.
+    POLL_INTERVAL: ClassVar[float] = 0.25
+
     highlighted: reactive[int] = reactive(-1)
 
     def __init__(self, job_manager: JobManager, **kwargs) -> None:
@@ -142,9 +146,7 @@ class JobListContent(Vertical):
 
     def on_mount(self) -> None:
         """Start polling for job updates."""
-        # Fast polling yields a "per-sample" feel without requiring an active
-        # inspect trace viewer.
-        self._refresh_timer = self.set_interval(0.25, self._poll_refresh)
+        self._refresh_timer = self.set_interval(self.POLL_INTERVAL, self._poll_refresh)
 
     def on_unmount(self) -> None:
         """Stop polling when unmounted."""
@@ -164,8 +166,11 @@ class JobListContent(Vertical):
     @work(exclusive=True, thread=True)
     def _refresh_jobs_in_thread(self) -> None:
         """Fetch jobs on a worker thread to avoid blocking the event loop."""
+        # Resolve the app before the slow read: once the widget is unmounted,
+        # self.app can no longer be found from this thread.
+        app = self.app
         fresh_jobs = self._job_manager.list_jobs(limit=20)
-        self.app.call_from_thread(self._apply_job_refresh, fresh_jobs)
+        app.call_from_thread(self._apply_job_refresh, fresh_jobs)
 
     def _apply_job_refresh(self, fresh_jobs: list[Job]) -> None:
         """Apply fetched job data to the UI (must run on main thread)."""
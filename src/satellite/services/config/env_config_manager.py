@@ -55,6 +55,8 @@ class EnvConfigManager:
     def __init__(self, env_path: Path) -> None:
         self._env_path = env_path
         self._lock = threading.Lock()
+        # ((st_mtime_ns, st_size), parsed vars) for the last read of the file.
+        self._cache: tuple[tuple[int, int], dict[str, str]] | None = None
 
     def _format_value(self, value: str) -> str:
         """Format value for .env file with appropriate quoting."""
@@ -68,10 +70,28 @@ class EnvConfigManager:
         return f'"{escaped}"'
 
     def _read_env(self) -> dict[str, str]:
-        """Read .env file into dict. Always reads from disk for external edit support."""
-        if not self._env_path.exists():
+        """Read .env file into dict.
+
+        The parse is cached and reused while the file's mtime and size are
+        unchanged, so external edits are still picked up. Returns a fresh
+        dict each call; callers may mutate it.
+        """
+        try:
+            stat = os.stat(self._env_path)
+        except FileNotFoundError:
+            self._cache = None
             return {}
-        return {k: v for k, v in dotenv_values(self._env_path).items() if v is not None}
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cache = self._cache
+        if cache is not None and cache[0] == key:
+            return dict(cache[1])
+
+        env_vars = {
+            k: v for k, v in dotenv_values(self._env_path).items() if v is not None
+        }
+        self._cache = (key, env_vars)
+        return dict(env_vars)
 
     def _write_env(self, env_vars: dict[str, str]) -> None:
         """Write dict to .env file with proper quoting and restricted permissions.
@@ -95,6 +115,9 @@ class EnvConfigManager:
                 data = data[written:]
         finally:
             os.close(fd)
+        # Re-parse on the next read; quoting does not round-trip every value
+        # byte-for-byte, so the written dict is not a safe cache entry.
+        self._cache = None
 
     def load_models(self) -> list[ModelConfig]:
         """Load models from INSPECT_EVAL_MODEL."""
@@ -1,6 +1,7 @@
 """EvalSettings - Configuration for inspect-ai evaluation parameters."""
 
 import json
+import os
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import ClassVar
@@ -8,7 +9,7 @@ from typing import ClassVar
 DEFAULT_SETTINGS_PATH = Path.home() / ".satellite" / "eval_settings.json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvalSettings:
     """Configuration for inspect-ai eval_set parameters."""
 
@@ -23,19 +24,41 @@ class EvalSettings:
     full_benchmark: bool = False
 
 
+# Parsed settings per file, keyed by path and validated against
+# (st_mtime_ns, st_size) so a same-tick rewrite of a different length is seen.
+_CACHE: dict[Path, tuple[tuple[int, int], EvalSettings]] = {}
+
+
 class EvalSettingsManager:
     """Manages eval settings persistence to JSON file."""
 
     def __init__(self, settings_path: Path = DEFAULT_SETTINGS_PATH) -> None:
         self._path = settings_path
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached settings so the next load() re-reads from disk."""
+        _CACHE.clear()
+
     def load(self) -> EvalSettings:
-        """Load settings from disk. Returns defaults if file missing."""
-        if not self._path.exists():
+        """Load settings from disk. Returns defaults if file missing.
+
+        The parsed result is cached until the file's mtime or size changes.
+        """
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            _CACHE.pop(self._path, None)
             return EvalSettings()
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _CACHE.get(self._path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         data = json.loads(self._path.read_text())
         defaults = EvalSettings()
-        return EvalSettings(
+        settings = EvalSettings(
             limit=data.get("limit"),
             epochs=data.get("epochs", defaults.epochs),
             max_connections=data.get("max_connections", defaults.max_connections),
@@ -43,8 +66,12 @@ class EvalSettingsManager:
             message_limit=data.get("message_limit"),
             full_benchmark=data.get("full_benchmark", False),
         )
+        _CACHE[self._path] = (key, settings)
+        return settings
 
     def save(self, settings: EvalSettings) -> None:
         """Save settings to disk."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._path.write_text(json.dumps(asdict(settings), indent=2) + "\n")
+        stat = os.stat(self._path)
+        _CACHE[self._path] = ((stat.st_mtime_ns, stat.st_size), settings)
@@ -1,13 +1,42 @@
 """Evaluation services for running and tracking benchmarks."""
 
-from satellite.services.evals.runner import EvalResult, EvalRunner
-from satellite.services.evals.job_manager import Job, JobDetails, JobManager, JobStatus
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from satellite.services.evals.registry import (
     BENCHMARKS,
     BENCHMARKS_BY_ID,
     BenchmarkConfig,
 )
 
+if TYPE_CHECKING:
+    from satellite.services.evals.job_manager import (
+        Job,
+        JobDetails,
+        JobManager,
+        JobStatus,
+    )
+    from satellite.services.evals.runner import EvalResult, EvalRunner
+
+# runner and job_manager import inspect_ai; load them on first access (PEP 562)
+# so that importing the registry alone stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
+    "EvalResult": "runner",
+    "EvalRunner": "runner",
+    "Job": "job_manager",
+    "JobDetails": "job_manager",
+    "JobManager": "job_manager",
+    "JobStatus": "job_manager",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
+
 __all__ = [
     "BENCHMARKS",
     "BENCHMARKS_BY_ID",
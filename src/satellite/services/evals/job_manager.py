@@ -1,7 +1,11 @@
 import json
 import logging
+import os
+import threading
 import time
-from collections.abc import Iterable, Iterator
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -36,6 +40,20 @@ STATUS_PRIORITY: dict[JobStatus, int] = {
 
 RECOVERABLE_LOG_READ_ERRORS = (ValueError, OSError, RuntimeError)
 
+# Headers of finished logs keyed by log name, validated against (mtime, size).
+# Finished logs are not rewritten, so repeated polls skip re-parsing them.
+_HEADER_CACHE: dict[str, tuple[tuple[float, int], EvalLog]] = {}
+_HEADER_CACHE_MAX = 1024
+# list_jobs loads jobs on several threads; eviction iterates the dict, so every
+# lookup, insert and eviction holds this lock.
+_HEADER_CACHE_LOCK = threading.Lock()
+
+# Loads job directories for list_jobs. Long-lived because the TUI polls
+# list_jobs several times a second; threads are only spawned on first use.
+_LOAD_JOB_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="satellite-load-job"
+)
+
 
 def _map_log_status(log: EvalLog) -> JobStatus:
     """Map an EvalLog status to a JobStatus, treating 'started' as 'running'."""
@@ -67,11 +85,9 @@ def _planned_units(log: EvalLog) -> int:
 
 def _load_satellite_progress(model_dir: Path) -> dict[str, dict]:
     """Load per-eval progress written by Inspect hooks (best-effort)."""
-    path = model_dir / SATELLITE_PROGRESS_FILE
-    if not path.exists():
-        return {}
+    # Missing file (no hook output) surfaces as OSError; no separate exists() stat.
     try:
-        data = json.loads(path.read_text())
+        data = json.loads((model_dir / SATELLITE_PROGRESS_FILE).read_bytes())
     except (OSError, json.JSONDecodeError, ValueError):
         return {}
     evals = data.get("evals")
@@ -243,6 +259,28 @@ class JobDetails:
     duration_seconds: float | None
 
 
+def _find_eval_set_files(job_dir: Path) -> list[Path]:
+    """Return every eval-set.json under *job_dir*.
+
+    Walks with ``os.scandir`` context managers so each directory handle is
+    closed as soon as it has been read, unlike a partially consumed ``rglob``.
+    """
+    found: list[Path] = []
+    pending = deque([job_dir])
+    while pending:
+        current = pending.popleft()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name == "eval-set.json":
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return found
+
+
 def _parse_eval_set(eval_set_file: Path) -> tuple[str, list[str]] | None:
     """Parse eval-set.json and return (model, benchmarks) or None."""
     try:
@@ -299,16 +337,36 @@ def extract_sample_count(log: EvalLog) -> tuple[str, str, int] | None:
 
 
 def _read_eval_log_header_safe(log_path: object) -> EvalLog | None:
-    """Read an eval log header, skipping empty/incomplete logs during active writes."""
-    if getattr(log_path, "size", None) == 0:
+    """Read an eval log header, skipping empty/incomplete logs during active writes.
+
+    Headers of finished logs are cached until the log's mtime or size changes.
+    """
+    size = getattr(log_path, "size", None)
+    if size == 0:
         return None
 
+    name = getattr(log_path, "name", None)
+    mtime = getattr(log_path, "mtime", None)
+    cacheable = isinstance(name, str) and mtime is not None and size is not None
+    if cacheable:
+        with _HEADER_CACHE_LOCK:
+            cached = _HEADER_CACHE.get(name)
+        if cached is not None and cached[0] == (mtime, size):
+            return cached[1]
+
     try:
-        return read_eval_log(log_path, header_only=True)
+        log = read_eval_log(log_path, header_only=True)
     except RECOVERABLE_LOG_READ_ERRORS as exc:
         _log.debug("Skipping unreadable eval log %s: %s", log_path, exc)
         return None
 
+    if cacheable and log.status != "started":
+        with _HEADER_CACHE_LOCK:
+            if len(_HEADER_CACHE) >= _HEADER_CACHE_MAX:
+                del _HEADER_CACHE[next(iter(_HEADER_CACHE))]
+            _HEADER_CACHE[name] = ((mtime, size), log)
+    return log
+
 
 def _load_job_sample_counts(job_dir: str) -> dict[str, dict[str, int]]:
     """Return {model: {benchmark: sample_count}}."""
@@ -389,7 +447,7 @@ def _load_job_details(job_dir: str) -> JobDetails | None:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Job:
     """An evaluation job tracking multiple models and their benchmarks."""
 
@@ -443,19 +501,29 @@ class JobManager:
             total_evals=total_evals,
         )
 
-    def job_dirs(self) -> Iterator[Path]:
+    def job_dirs(self) -> list[Path]:
+        """Return job directories, closing the directory handle before returning."""
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
-        for path in self.jobs_dir.iterdir():
-            if path.is_dir() and path.name.startswith("job_"):
-                yield path
+        try:
+            entries = os.scandir(self.jobs_dir)
+        except FileNotFoundError:
+            return []  # Deleted again between mkdir() and scandir().
+        with entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("job_") and entry.is_dir()
+            ]
 
     def load_job(self, job_dir: Path) -> Job | None:
         """Load a job from the filesystem using manifest or eval-set fallback."""
         evals, total_evals, settings = self._load_from_manifest(job_dir)
 
-        # Fallback for legacy jobs without manifest
+        # Fallback for legacy jobs without manifest; walk the tree only once
+        eval_files: list[Path] | None = None
         if not evals:
-            evals, total_evals = self._load_evals_from_eval_sets(job_dir)
+            eval_files = _find_eval_set_files(job_dir)
+            evals, total_evals = self._load_evals_from_eval_sets(eval_files)
             settings = EvalSettings()
 
         if not evals:
@@ -467,7 +535,7 @@ class JobManager:
             return Job(
                 id=job_dir.name,
                 evals=evals,
-                created_at=self._job_created_at(job_dir),
+                created_at=self._job_created_at(job_dir, eval_files),
                 status="cancelled",
                 total_evals=total_evals,
                 settings=settings,
@@ -480,7 +548,7 @@ class JobManager:
             return Job(
                 id=job_dir.name,
                 evals=evals,
-                created_at=self._job_created_at(job_dir),
+                created_at=self._job_created_at(job_dir, eval_files),
                 status="running",
                 total_evals=total_evals,
                 settings=settings,
@@ -534,7 +602,7 @@ class JobManager:
         return Job(
             id=job_dir.name,
             evals=evals,
-            created_at=self._job_created_at(job_dir),
+            created_at=self._job_created_at(job_dir, eval_files),
             status=status,
             settings=settings,
             completed_evals=completed_evals,
@@ -575,11 +643,11 @@ class JobManager:
         return data.get("evals", {}), data.get("total_evals", 0), settings
 
     def _load_evals_from_eval_sets(
-        self, job_dir: Path
+        self, eval_files: Iterable[Path]
     ) -> tuple[dict[str, list[str]], int]:
-        """Fallback: scan eval-set.json files for legacy jobs without manifest."""
+        """Fallback: parse eval-set.json files for legacy jobs without manifest."""
         evals: dict[str, list[str]] = {}
-        for eval_file in job_dir.glob("**/eval-set.json"):
+        for eval_file in eval_files:
             parsed = _parse_eval_set(eval_file)
             if parsed is None:
                 continue
@@ -602,19 +670,32 @@ class JobManager:
         """Check whether a cancelled marker file exists for this job."""
         return (job_dir / CANCELLED_MARKER).exists()
 
-    def _job_created_at(self, job_dir: Path) -> datetime:
-        """Determine job creation time from manifest or eval-set files."""
+    def _job_created_at(
+        self, job_dir: Path, eval_files: list[Path] | None = None
+    ) -> datetime:
+        """Determine job creation time from manifest or eval-set files.
+
+        *eval_files* lets callers that already walked the job tree skip a rescan.
+        """
         manifest_path = job_dir / "job-manifest.json"
         if manifest_path.exists():
             return datetime.fromtimestamp(manifest_path.stat().st_mtime)
-        eval_files = list(job_dir.glob("**/eval-set.json"))
+        if eval_files is None:
+            eval_files = _find_eval_set_files(job_dir)
         if not eval_files:
             return datetime.now()
         return min(datetime.fromtimestamp(f.stat().st_mtime) for f in eval_files)
 
     def list_jobs(self, limit: int | None = None) -> list[Job]:
         """List jobs, running first, then by recency."""
-        jobs = [job for d in self.job_dirs() if (job := self.load_job(d))]
+        dirs = self.job_dirs()
+        if len(dirs) > 1:
+            # Log reads are I/O bound; map() keeps dir order and re-raises the
+            # first load_job error, like the sequential loop.
+            loaded = list(_LOAD_JOB_POOL.map(self.load_job, dirs))
+        else:
+            loaded = [self.load_job(d) for d in dirs]
+        jobs = [job for job in loaded if job]
         jobs.sort(key=lambda j: (j.status != "running", -j.created_at.timestamp()))
 
         if limit is None:
@@ -8,10 +8,10 @@ from __future__ import annotations
 
 import inspect
 import logging
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from importlib import import_module
 from types import ModuleType
-from typing import Callable
 
 _log = logging.getLogger(__name__)
 
@@ -82,19 +82,31 @@ _FULL_SAMPLE_COUNT_OVERRIDES: dict[str, int] = {
     "srsranbench": 1_500,
 }
 
+# Both override tables flattened into one lookup keyed by (eval_id, full).
+_SAMPLE_COUNTS: dict[tuple[str, bool], int] = {
+    **{(eval_id, False): n for eval_id, n in _SAMPLE_COUNT_OVERRIDES.items()},
+    **{(eval_id, True): n for eval_id, n in _FULL_SAMPLE_COUNT_OVERRIDES.items()},
+}
+
 
-def get_total_samples(eval_id: str, full: bool = False) -> int:
+def get_total_samples(
+    eval_id: str,
+    full: bool = False,
+    *,
+    benchmarks_by_id: Mapping[str, BenchmarkConfig] | None = None,
+) -> int:
     """Return the expected sample count for *eval_id*.
 
     When *full* is ``True`` the count comes from ``_FULL_SAMPLE_COUNT_OVERRIDES``;
     otherwise from the regular ``_SAMPLE_COUNT_OVERRIDES``. If no override exists,
-    fall back to the discovered benchmark metadata.
+    fall back to the benchmark metadata in *benchmarks_by_id* (defaults to the
+    discovered ``BENCHMARKS_BY_ID``).
     """
-    overrides = _FULL_SAMPLE_COUNT_OVERRIDES if full else _SAMPLE_COUNT_OVERRIDES
-    count = overrides.get(eval_id)
+    count = _SAMPLE_COUNTS.get((eval_id, full))
     if count is not None:
         return count
-    config = BENCHMARKS_BY_ID.get(eval_id)
+    table = BENCHMARKS_BY_ID if benchmarks_by_id is None else benchmarks_by_id
+    config = table.get(eval_id)
     if config is not None:
         return config.total_samples
     return 0
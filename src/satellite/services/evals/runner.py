@@ -9,6 +9,7 @@ import os
 import signal
 import subprocess
 import threading
+from collections.abc import Callable
 from pathlib import Path
 from typing import NamedTuple
 
@@ -39,9 +40,20 @@ class EvalRunner:
     is called from the main thread.
     """
 
-    def __init__(self, jobs_dir: Path) -> None:
-        """Initialize with jobs directory for log output."""
+    def __init__(
+        self,
+        jobs_dir: Path,
+        popen_factory: Callable[..., subprocess.Popen[str]] | None = None,
+    ) -> None:
+        """Initialize with jobs directory for log output.
+
+        Args:
+            jobs_dir: Directory where per-job logs are written.
+            popen_factory: Callable used to start the worker process. Defaults
+                to ``subprocess.Popen`` (resolved at call time).
+        """
         self.jobs_dir = jobs_dir
+        self._popen_factory = popen_factory
         self._lock = threading.Lock()
         self._active_processes: dict[str, subprocess.Popen[str]] = {}
         self._cancelled_jobs: set[str] = set()
@@ -168,9 +180,11 @@ class EvalRunner:
         # Keep default behavior implicit: omitted means "false" in worker config.
         if settings.full_benchmark:
             config_dict["full_benchmark"] = True
-        config = json.dumps(config_dict)
+        # Compact separators: the payload is only read by the worker's json.load.
+        config = json.dumps(config_dict, separators=(",", ":"))
 
-        process = subprocess.Popen(
+        popen = self._popen_factory or subprocess.Popen
+        process = popen(
             WORKER_CMD,
             cwd=UV_PROJECT_ROOT,
             stdin=subprocess.PIPE,
@@ -21,6 +21,7 @@ If ``full_benchmark`` is omitted, it defaults to ``false`` (sample split).
 Exit codes: 0=success, 1=error, 2=cancelled
 """
 
+import functools
 import inspect
 import json
 import logging
@@ -40,12 +41,13 @@ EVAL_LOG_FORMAT = "json"
 EVAL_DISPLAY = "none"
 
 
+@functools.cache
 def _accepts_full_keyword(task_fn: Callable[..., object]) -> bool:
     """Return ``True`` when ``task_fn`` can be called with ``full=True``.
 
     Task factories should expose explicit keyword parameters (for example
     ``def teleqna(*, full: bool = False) -> Task``) so this inspection remains
-    predictable.
+    predictable. The answer is cached per factory.
     """
     try:
         signature = inspect.signature(task_fn)
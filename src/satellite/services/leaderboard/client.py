@@ -75,15 +75,17 @@ def collect_local_entries(
     seen: dict[str, LeaderboardEntry] = {}
 
     for job in job_manager.list_jobs():
+        candidates = [
+            model_id
+            for model_id, ran_evals in job.evals.items()
+            if model_id not in seen and bench_ids.issubset(ran_evals)
+        ]
+        # Reading results touches the job's logs; skip jobs with nothing new.
+        if not candidates:
+            continue
         job_results = job_manager.get_job_results(job.id)
 
-        for model_id, ran_evals in job.evals.items():
-            if model_id in seen:
-                continue
-
-            if not bench_ids.issubset(ran_evals):
-                continue
-
+        for model_id in candidates:
             model_scores = job_results.get(model_id, {})
             if not bench_ids.issubset(model_scores):
                 continue
@@ -43,7 +43,7 @@ class SubmitResult:
     error: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubmitPreview:
     """Preview of what will be submitted to the leaderboard."""
 
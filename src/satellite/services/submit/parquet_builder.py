@@ -7,6 +7,8 @@ bypassing the GitHub blob size limit that raw JSON trajectories hit.
 from __future__ import annotations
 
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -25,6 +27,13 @@ MODEL_CARDS_DIR = "model_cards"
 # Parquet score columns in registry order (deduplicated by hf_column).
 SCORE_COLUMNS = tuple(dict.fromkeys(b.hf_column for b in BENCHMARKS))
 
+# Fixed leaderboard schema: each score column holds [score, stderr, n_samples].
+PARQUET_SCHEMA = pa.schema(
+    [pa.field("model", pa.string())]
+    + [pa.field(col, pa.list_(pa.float64())) for col in SCORE_COLUMNS]
+    + [pa.field("date", pa.string())]
+)
+
 _PATH_TRAVERSAL_PATTERNS = ("..", "/", "\\")
 
 
@@ -82,9 +91,15 @@ def _collect_benchmark_scores(
         Dict mapping hf_column name to (score, stderr, n_samples).
     """
     scores: dict[str, tuple[float, float, int]] = {}
+    if not log_files:
+        return scores
+
+    # Header reads are I/O bound; map() keeps file order, so later logs still win.
+    workers = min(len(log_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        logs = list(pool.map(_read_header, log_files))
 
-    for log_path in log_files:
-        log = read_eval_log(str(log_path), header_only=True)
+    for log in logs:
         extracted = _extract_score(log)
         if extracted is None:
             continue
@@ -94,6 +109,10 @@ def _collect_benchmark_scores(
     return scores
 
 
+def _read_header(log_path: Path) -> EvalLog:
+    return read_eval_log(str(log_path), header_only=True)
+
+
 def _extract_score(log: EvalLog) -> tuple[str, float, float, int] | None:
     """Extract (hf_column, score_pct, stderr_pct, n_samples) from one log."""
     if not log.eval or not log.eval.task:
@@ -149,22 +168,7 @@ def _build_row(
 
 def _write_parquet(row: dict[str, object]) -> bytes:
     """Serialize a single-row dict to parquet bytes using pyarrow."""
-    score_type = pa.list_(pa.float64())
-    schema = pa.schema(
-        [pa.field("model", pa.string())]
-        + [pa.field(col, score_type) for col in SCORE_COLUMNS]
-        + [pa.field("date", pa.string())]
-    )
-
-    arrays = []
-    for field in schema:
-        value = row.get(field.name)
-        if field.name in SCORE_COLUMNS:
-            arrays.append(pa.array([value], type=score_type))
-            continue
-        arrays.append(pa.array([value], type=field.type))
-
-    table = pa.table(arrays, schema=schema)
+    table = pa.Table.from_pylist([row], schema=PARQUET_SCHEMA)
 
     buf = io.BytesIO()
     pq.write_table(table, buf)
@@ -11,11 +11,12 @@ Covers:
 5. Full SatelliteApp leaderboard open/close via key "2"
 """
 
-import asyncio
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from textual.app import App
 from textual.strip import Strip
 from textual.widgets import Static
@@ -23,17 +24,24 @@ from textual.widgets import Static
 from satellite.app import SatelliteApp
 from satellite.modals import TabbedEvalsModal
 from satellite.modals.scripts.leaderboard_modal import LeaderboardModal
+from satellite.modals.scripts.tabbed_evals_modal import JobListContent
+from satellite.screens.main import MainScreen
 from satellite.services.config import EvalSettingsManager, ModelConfig
 from satellite.services.evals import JobManager
 from satellite.services.leaderboard import LeaderboardEntry
+from satellite.widgets.tab_header import TabHeader
+from satellite.widgets.tab_item import TabItem
 from tests.conftest import MOCK_NONEXISTENT_PID
 
+# Share one event loop across the module instead of one loop per test.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-SAMPLE_ENTRIES = [
+SAMPLE_ENTRIES = (
     LeaderboardEntry(
         model="gpt-4o",
         provider="OpenAI",
@@ -48,7 +56,12 @@ SAMPLE_ENTRIES = [
         avg_score=80.0,
         is_local=True,
     ),
-]
+)
+
+# Built once and shared by every patched_leaderboard use.
+_FETCH_MOCK = MagicMock(return_value=SAMPLE_ENTRIES)
+_LOCAL_MOCK = MagicMock(return_value=[])
+_MERGE_MOCK = MagicMock(return_value=SAMPLE_ENTRIES)
 
 
 def _make_mock_job_manager() -> MagicMock:
@@ -61,19 +74,76 @@ def _make_mock_job_manager() -> MagicMock:
 
 
 def _make_slow_job_manager(delay: float = 1.0) -> MagicMock:
-    """Create a mock JobManager whose list_jobs blocks for *delay* seconds."""
+    """Create a mock JobManager whose worker-thread list_jobs blocks for up to *delay* seconds.
+
+    The block is an Event wait rather than a sleep, so tests can release
+    any in-flight worker early via ``manager._cancel.set()``. Calls on the
+    main thread (the synchronous listing in ``compose``) return immediately,
+    so only the background refresh is held back. Each worker-thread call is
+    appended to ``manager._worker_calls`` before it blocks.
+    """
     manager = MagicMock(spec=JobManager)
+    cancel = threading.Event()
+    worker_calls: list[str] = []
 
     def slow_list_jobs(limit=None):
-        time.sleep(delay)
+        if threading.current_thread() is not threading.main_thread():
+            worker_calls.append(threading.current_thread().name)
+            cancel.wait(delay)
         return []
 
     manager.list_jobs.side_effect = slow_list_jobs
     manager.get_job.return_value = None
     manager.jobs_dir = "/tmp/fake_jobs"
+    manager._cancel = cancel
+    manager._worker_calls = worker_calls
     return manager
 
 
+def _tabs(modal: TabbedEvalsModal) -> list[TabItem]:
+    """Return the modal's tab items (Evals, Progress, Settings)."""
+    return list(modal.query_one("#tab-header", TabHeader).query(TabItem))
+
+
+async def wait_until(pred, pilot, timeout: float = 1.0) -> None:
+    """Pump the event loop until *pred* is true or *timeout* seconds elapse.
+
+    Returns as soon as the state transition is observed instead of forcing a
+    fixed number of pauses; callers assert on the state afterwards.
+    """
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if pred():
+            return
+        await pilot.pause()
+
+
+async def wait_for_screen(app: App, cls: type, pilot, timeout: float = 1.0) -> None:
+    """Wait until *cls* is the active screen (e.g. after ``run_test()`` entry)."""
+    await wait_until(lambda: isinstance(app.screen, cls), pilot, timeout)
+
+
+@pytest.fixture
+def patched_leaderboard():
+    """Patch the leaderboard data sources to return SAMPLE_ENTRIES."""
+    for mock in (_FETCH_MOCK, _LOCAL_MOCK, _MERGE_MOCK):
+        mock.reset_mock()
+    with patch.multiple(
+        "satellite.modals.scripts.leaderboard_modal",
+        fetch_leaderboard=_FETCH_MOCK,
+        collect_local_entries=_LOCAL_MOCK,
+        merge_leaderboard=_MERGE_MOCK,
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _fast_progress_timer():
+    """Poll the Progress tab every 50ms so workers start without a timer wait."""
+    with patch.object(JobListContent, "POLL_INTERVAL", 0.05):
+        yield
+
+
 # ---------------------------------------------------------------------------
 # Lightweight test apps (no subprocess or filesystem side-effects)
 # ---------------------------------------------------------------------------
@@ -93,16 +163,35 @@ class LeaderboardStressApp(App):
 
 
 class TabbedEvalsStressApp(App):
-    """Minimal app that pushes a TabbedEvalsModal on mount."""
+    """Minimal app that pushes a TabbedEvalsModal on mount.
+
+    Records the outcome of every ``call_from_thread`` so tests can wait for
+    released workers to finish their callbacks and check none of them raised.
+    """
 
     def __init__(self, job_manager=None):
         super().__init__()
         self._job_manager = job_manager or _make_mock_job_manager()
+        self.thread_callbacks_done = 0
+        self.thread_callback_errors: list[BaseException] = []
+
+    def call_from_thread(self, callback, *args, **kwargs):
+        try:
+            return super().call_from_thread(callback, *args, **kwargs)
+        except BaseException as exc:
+            self.thread_callback_errors.append(exc)
+            raise
+        finally:
+            self.thread_callbacks_done += 1
 
     def on_mount(self):
+        self.push_evals_modal(self._job_manager)
+
+    def push_evals_modal(self, job_manager) -> None:
+        """Push a fresh TabbedEvalsModal backed by *job_manager*."""
         self.push_screen(
             TabbedEvalsModal(
-                job_manager=self._job_manager,
+                job_manager=job_manager,
                 settings_manager=EvalSettingsManager(),
                 model_configs=[
                     ModelConfig(
@@ -123,32 +212,38 @@ class MainScreenStressApp(App):
         super().__init__()
 
     def on_mount(self):
-        from satellite.screens.main import MainScreen
-
         self.push_screen(MainScreen())
 
 
+@pytest_asyncio.fixture(loop_scope="module")
+async def tabbed_app(request):
+    """Yield a mounted ``(TabbedEvalsStressApp, pilot)`` pair.
+
+    Parametrize indirectly with a delay in seconds to back the modal with
+    ``_make_slow_job_manager(delay)`` instead of the default mock.
+    """
+    delay = getattr(request, "param", None)
+    if delay is None:
+        job_manager = _make_mock_job_manager()
+    else:
+        job_manager = _make_slow_job_manager(delay=delay)
+    app = TabbedEvalsStressApp(job_manager=job_manager)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        yield app, pilot
+
+
 # ---------------------------------------------------------------------------
 # Test 1 – Rapid leaderboard open/close (LeaderboardModal x5)
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("patched_leaderboard")
+@pytest.mark.xdist_group("stress-leaderboard")
 class TestRapidLeaderboardOpenClose:
     """Rapidly open and close the leaderboard modal to check for crashes."""
 
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.collect_local_entries",
-        return_value=[],
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.merge_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    async def test_rapid_open_close_with_data(self, _merge, _local, _fetch):
+    async def test_rapid_open_close_with_data(self):
         """Open -> close leaderboard 5x with data — no crash."""
         mock_jm = _make_mock_job_manager()
 
@@ -156,43 +251,29 @@ class TestRapidLeaderboardOpenClose:
             app = LeaderboardStressApp(job_manager=mock_jm)
             async with app.run_test() as pilot:
                 # Give the worker time to complete
-                await pilot.pause()
+                await wait_for_screen(app, LeaderboardModal, pilot)
                 await pilot.pause()
                 # Dismiss
                 await pilot.press("escape")
                 await pilot.pause()
 
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        side_effect=OSError("Network down"),
-    )
-    async def test_rapid_open_close_with_error(self, _fetch):
+    async def test_rapid_open_close_with_error(self):
         """Open -> close leaderboard 5x when fetch raises — no crash."""
         mock_jm = _make_mock_job_manager()
 
-        for cycle in range(5):
-            app = LeaderboardStressApp(job_manager=mock_jm)
-            async with app.run_test() as pilot:
-                await pilot.pause()
-                await pilot.pause()
-                await pilot.press("escape")
-                await pilot.pause()
-
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.collect_local_entries",
-        return_value=[],
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.merge_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    async def test_immediate_escape_before_worker_completes(
-        self, _merge, _local, _fetch
-    ):
+        with patch(
+            "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
+            side_effect=OSError("Network down"),
+        ):
+            for cycle in range(5):
+                app = LeaderboardStressApp(job_manager=mock_jm)
+                async with app.run_test() as pilot:
+                    await wait_for_screen(app, LeaderboardModal, pilot)
+                    await pilot.pause()
+                    await pilot.press("escape")
+                    await pilot.pause()
+
+    async def test_immediate_escape_before_worker_completes(self):
         """Press escape immediately — worker may still be running."""
         mock_jm = _make_mock_job_manager()
         app = LeaderboardStressApp(job_manager=mock_jm)
@@ -207,61 +288,40 @@ class TestRapidLeaderboardOpenClose:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("patched_leaderboard")
+@pytest.mark.xdist_group("stress-polling")
 class TestLeaderboardDuringEvalPolling:
     """Open leaderboard on top of TabbedEvalsModal while polling is active."""
 
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.collect_local_entries",
-        return_value=[],
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.merge_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    async def test_leaderboard_over_polling_progress_tab(
-        self, _merge, _local, _fetch
-    ):
+    async def test_leaderboard_over_polling_progress_tab(self, tabbed_app):
         """Push leaderboard modal while Progress tab timer is running."""
-        mock_jm = _make_mock_job_manager()
-        app = TabbedEvalsStressApp(job_manager=mock_jm)
+        app, pilot = tabbed_app
+        mock_jm = app._job_manager
+        modal = app.screen
+        assert isinstance(modal, TabbedEvalsModal)
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            modal = app.screen
-            assert isinstance(modal, TabbedEvalsModal)
+        # Switch to Progress tab (second tab)
+        tabs = _tabs(modal)
+        await pilot.click(tabs[1])
+        await pilot.pause()
 
-            # Switch to Progress tab (second tab)
-            from satellite.widgets.tab_header import TabHeader
-            from satellite.widgets.tab_item import TabItem
+        # Progress tab is now active and its poll timer is running.
+        # Push a leaderboard modal on top.
+        app.push_screen(LeaderboardModal(job_manager=mock_jm))
+        await wait_until(lambda: isinstance(app.screen, LeaderboardModal), pilot)
 
-            tabs = list(
-                modal.query_one("#tab-header", TabHeader).query(TabItem)
-            )
-            await pilot.click(tabs[1])
-            await pilot.pause()
+        # The top screen should be the leaderboard
+        assert isinstance(app.screen, LeaderboardModal)
 
-            # Progress tab is now active and its 2s timer is running.
-            # Push a leaderboard modal on top.
-            app.push_screen(LeaderboardModal(job_manager=mock_jm))
-            await pilot.pause()
-            await pilot.pause()
-
-            # The top screen should be the leaderboard
-            assert isinstance(app.screen, LeaderboardModal)
+        # Close the leaderboard
+        await pilot.press("escape")
+        await wait_until(lambda: isinstance(app.screen, TabbedEvalsModal), pilot)
 
-            # Close the leaderboard
-            await pilot.press("escape")
-            await pilot.pause()
+        # We should be back on the TabbedEvalsModal
+        assert isinstance(app.screen, TabbedEvalsModal)
 
-            # We should be back on the TabbedEvalsModal
-            assert isinstance(app.screen, TabbedEvalsModal)
-
-            # Verify the progress tab is still the active tab
-            assert modal.active_tab == "view-progress"
+        # Verify the progress tab is still the active tab
+        assert modal.active_tab == "view-progress"
 
 
 # ---------------------------------------------------------------------------
@@ -269,53 +329,55 @@ class TestLeaderboardDuringEvalPolling:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group("stress-tabs")
 class TestRapidTabSwitching:
     """Rapidly switch tabs in TabbedEvalsModal to stress reactive updates."""
 
-    async def test_rapid_tab_cycling_10_times(self):
+    async def test_rapid_tab_cycling_10_times(self, tabbed_app):
         """Press Tab 10 times rapidly — no crash or hang."""
-        mock_jm = _make_mock_job_manager()
-        app = TabbedEvalsStressApp(job_manager=mock_jm)
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            # The TabbedEvalsModal overrides tab to switch between
-            # Evals / Progress / Settings tabs.
-            for _ in range(10):
-                await pilot.press("tab")
-                # Small pause to let event loop tick
-                await pilot.pause()
-
-            # Modal should still be alive and responsive
-            modal = app.screen
-            assert isinstance(modal, TabbedEvalsModal)
-
-            # Verify we can still dismiss
-            await pilot.press("escape")
-            await pilot.pause()
-            assert not isinstance(app.screen, TabbedEvalsModal)
+        app, pilot = tabbed_app
+
+        # The TabbedEvalsModal overrides tab to switch between
+        # Evals / Progress / Settings tabs. One real key press covers the
+        # binding; the rest drive the same action directly.
+        modal = app.screen
+        assert isinstance(modal, TabbedEvalsModal)
+        await pilot.press("tab")
+        await pilot.pause()
+        for _ in range(9):
+            modal.action_next_tab()
+        await pilot.pause()
+
+        # Modal should still be alive and responsive
+        assert app.screen is modal
+        # 10 steps through 3 tabs lands on the second one
+        assert modal.active_tab == "view-progress"
+
+        # Verify we can still dismiss
+        await pilot.press("escape")
+        await wait_until(
+            lambda: not isinstance(app.screen, TabbedEvalsModal), pilot
+        )
+        assert not isinstance(app.screen, TabbedEvalsModal)
 
-    async def test_rapid_tab_switching_interleaved_with_escape(self):
+    async def test_rapid_tab_switching_interleaved_with_escape(self, tabbed_app):
         """Tab-Tab-Escape pattern — ensure no stale state."""
-        mock_jm = _make_mock_job_manager()
-        app = TabbedEvalsStressApp(job_manager=mock_jm)
+        app, pilot = tabbed_app
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        # Switch a couple of tabs, then dismiss
+        await pilot.press("tab")
+        await pilot.pause()
+        await pilot.press("tab")
+        await pilot.pause()
 
-            # Switch a couple of tabs, then dismiss
-            await pilot.press("tab")
-            await pilot.pause()
-            await pilot.press("tab")
-            await pilot.pause()
-
-            modal = app.screen
-            assert isinstance(modal, TabbedEvalsModal)
+        modal = app.screen
+        assert isinstance(modal, TabbedEvalsModal)
 
-            await pilot.press("escape")
-            await pilot.pause()
-            assert not isinstance(app.screen, TabbedEvalsModal)
+        await pilot.press("escape")
+        await wait_until(
+            lambda: not isinstance(app.screen, TabbedEvalsModal), pilot
+        )
+        assert not isinstance(app.screen, TabbedEvalsModal)
 
 
 # ---------------------------------------------------------------------------
@@ -323,74 +385,83 @@ class TestRapidTabSwitching:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.xdist_group("stress-dismiss")
 class TestDismissDuringWorker:
     """Dismiss TabbedEvalsModal while a background worker is still running."""
 
-    async def test_escape_during_slow_refresh(self):
+    @pytest.mark.parametrize("tabbed_app", [1.0], indirect=True)
+    async def test_escape_during_slow_refresh(self, tabbed_app):
         """Dismiss modal while _refresh_jobs_in_thread is blocked on IO.
 
         This tests for NoActiveApp / widget-not-found errors that happen
         when call_from_thread returns to a widget that has been unmounted.
         """
-        slow_jm = _make_slow_job_manager(delay=1.0)
-        app = TabbedEvalsStressApp(job_manager=slow_jm)
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            modal = app.screen
-            assert isinstance(modal, TabbedEvalsModal)
-
-            # Switch to Progress tab to trigger the polling timer / worker
-            from satellite.widgets.tab_header import TabHeader
-            from satellite.widgets.tab_item import TabItem
-
-            tabs = list(
-                modal.query_one("#tab-header", TabHeader).query(TabItem)
-            )
-            await pilot.click(tabs[1])
-            await pilot.pause()
-
-            # The worker is now sleeping for 1s in list_jobs.
-            # Dismiss immediately — the worker's call_from_thread callback
-            # will fire after the modal is already gone.
-            await pilot.press("escape")
-            await pilot.pause()
-
-            assert not isinstance(app.screen, TabbedEvalsModal)
-
-            # Give the slow worker time to finish and attempt its callback
-            # (this is where NoActiveApp would surface if unguarded).
-            await asyncio.sleep(1.5)
-            await pilot.pause()
-            # If we reach here without exception, the app survived.
+        app, pilot = tabbed_app
+        slow_jm = app._job_manager
+        modal = app.screen
+        assert isinstance(modal, TabbedEvalsModal)
+
+        # Switch to Progress tab to trigger the polling timer / worker
+        tabs = _tabs(modal)
+        await pilot.click(tabs[1])
+        await wait_until(lambda: slow_jm._worker_calls, pilot)
+
+        # The worker is now blocked for up to 1s in list_jobs.
+        # Dismiss immediately — the worker's call_from_thread callback
+        # will fire after the modal is already gone.
+        await pilot.press("escape")
+        await pilot.pause()
+
+        assert not isinstance(app.screen, TabbedEvalsModal)
+
+        # Release the blocked worker so it attempts its callback now
+        # (this is where NoActiveApp would surface if unguarded).
+        workers = len(slow_jm._worker_calls)
+        assert workers >= 1
+        slow_jm._cancel.set()
+        await wait_until(lambda: app.thread_callbacks_done >= workers, pilot)
+
+        assert app.thread_callbacks_done >= workers
+        assert app.thread_callback_errors == []
 
     async def test_multiple_dismiss_during_worker(self):
-        """Rapid open -> escape cycles with slow job manager."""
+        """Rapid open -> Progress -> escape cycles with slow job managers."""
         slow_jm = _make_slow_job_manager(delay=0.5)
+        app = TabbedEvalsStressApp(job_manager=slow_jm)
+        async with app.run_test() as pilot:
+            await _dismiss_progress_during_worker(app, pilot, slow_jm)
+            for _ in range(2):
+                # A fresh manager (and Event) per cycle: re-arming a shared
+                # Event would block workers left from the last cycle again.
+                slow_jm = _make_slow_job_manager(delay=0.5)
+                app.push_evals_modal(slow_jm)
+                await _dismiss_progress_during_worker(app, pilot, slow_jm)
+
+            assert app.thread_callback_errors == []
+
+
+async def _dismiss_progress_during_worker(app, pilot, slow_jm) -> None:
+    """Open Progress, escape while its worker blocks, then release the worker."""
+    # A just-pushed modal adds its tabs on mount
+    await wait_until(
+        lambda: isinstance(app.screen, TabbedEvalsModal)
+        and len(app.screen.query(TabItem)) == 3,
+        pilot,
+    )
 
-        for _ in range(3):
-            app = TabbedEvalsStressApp(job_manager=slow_jm)
-            async with app.run_test() as pilot:
-                await pilot.pause()
+    # The Progress tab's poll timer starts the blocked worker
+    await pilot.click(_tabs(app.screen)[1])
+    await wait_until(lambda: slow_jm._worker_calls, pilot)
 
-                # Switch to Progress tab
-                from satellite.widgets.tab_header import TabHeader
-                from satellite.widgets.tab_item import TabItem
+    await pilot.press("escape")
+    await wait_until(lambda: not isinstance(app.screen, TabbedEvalsModal), pilot)
+    assert not isinstance(app.screen, TabbedEvalsModal)
 
-                modal = app.screen
-                tabs = list(
-                    modal.query_one("#tab-header", TabHeader).query(TabItem)
-                )
-                await pilot.click(tabs[1])
-                await pilot.pause()
-
-                # Dismiss while worker may still be running
-                await pilot.press("escape")
-                await pilot.pause()
-
-                # Brief sleep to let any orphaned callbacks fire
-                await asyncio.sleep(0.7)
-                await pilot.pause()
+    # Release the workers; each callback lands on the unmounted tab
+    expected = app.thread_callbacks_done + len(slow_jm._worker_calls)
+    slow_jm._cancel.set()
+    await wait_until(lambda: app.thread_callbacks_done >= expected, pilot)
+    assert app.thread_callbacks_done >= expected
 
 
 # ---------------------------------------------------------------------------
@@ -398,28 +469,22 @@ class TestDismissDuringWorker:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("patched_leaderboard")
 @patch("satellite.widgets.julia_set.JuliaSet.render_line", return_value=Strip([]))
+@pytest.mark.xdist_group("stress-satellite-app")
 class TestSatelliteAppLeaderboardKey:
     """Drive the real SatelliteApp with mocked externals."""
 
     @patch("satellite.app.subprocess.Popen")
     @patch("satellite.app.JobManager")
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.collect_local_entries",
-        return_value=[],
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.merge_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    async def test_press_2_opens_leaderboard(
-        self, _merge, _local, _fetch, mock_jm_cls, mock_popen, _julia
+    async def test_satellite_app_leaderboard_flows(
+        self, mock_jm_cls, mock_popen, _julia
     ):
-        """Press '2' on MainScreen -> LeaderboardModal appears."""
+        """Open, error and rapid-cycle the leaderboard on one booted SatelliteApp.
+
+        The scenarios run back to back inside a single ``run_test()`` session
+        so the full app is only mounted once.
+        """
         # Configure the mocked JobManager class
         mock_jm_instance = _make_mock_job_manager()
         mock_jm_cls.return_value = mock_jm_instance
@@ -433,109 +498,48 @@ class TestSatelliteAppLeaderboardKey:
         mock_popen.return_value = mock_process
 
         app = SatelliteApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            await pilot.pause()
-            await pilot.pause()
-
-            # MainScreen should be the current screen
-            from satellite.screens.main import MainScreen
+        async with app.run_test(size=(20, 10)) as pilot:
+            await wait_for_screen(app, MainScreen, pilot)
 
+            # Happy path: press "2" on MainScreen -> LeaderboardModal appears
             assert isinstance(app.screen, MainScreen)
-
-            # Press "2" to open leaderboard
             await pilot.press("2")
-            await pilot.pause()
-            await pilot.pause()
-
+            await wait_until(lambda: isinstance(app.screen, LeaderboardModal), pilot)
             assert isinstance(app.screen, LeaderboardModal)
 
-            # Dismiss
             await pilot.press("escape")
-            await pilot.pause()
-
+            await wait_until(lambda: isinstance(app.screen, MainScreen), pilot)
             assert isinstance(app.screen, MainScreen)
 
-    @patch("satellite.app.subprocess.Popen")
-    @patch("satellite.app.JobManager")
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        side_effect=OSError("Network error"),
-    )
-    async def test_press_2_leaderboard_error_then_dismiss(
-        self, _fetch, mock_jm_cls, mock_popen, _julia
-    ):
-        """Press '2' when fetch fails -> see error -> dismiss cleanly."""
-        mock_jm_instance = _make_mock_job_manager()
-        mock_jm_cls.return_value = mock_jm_instance
-
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = MOCK_NONEXISTENT_PID
-        mock_popen.return_value = mock_process
-
-        app = SatelliteApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            await pilot.pause()
-            await pilot.pause()
-
-            await pilot.press("2")
-            await pilot.pause()
-            await pilot.pause()
-
-            modal = app.screen
-            assert isinstance(modal, LeaderboardModal)
-
-            # Error text should be visible
-            error_widget = modal.query_one("#error-text", Static)
-            assert error_widget.display is True
-            rendered = str(error_widget.render())
-            assert "Network error" in rendered
-
-            await pilot.press("escape")
-            await pilot.pause()
-
-            from satellite.screens.main import MainScreen
-
-            assert isinstance(app.screen, MainScreen)
-
-    @patch("satellite.app.subprocess.Popen")
-    @patch("satellite.app.JobManager")
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.collect_local_entries",
-        return_value=[],
-    )
-    @patch(
-        "satellite.modals.scripts.leaderboard_modal.merge_leaderboard",
-        return_value=SAMPLE_ENTRIES,
-    )
-    async def test_rapid_2_escape_on_satellite_app(
-        self, _merge, _local, _fetch, mock_jm_cls, mock_popen, _julia
-    ):
-        """Rapidly press 2 -> Escape 3 times on the real SatelliteApp."""
-        mock_jm_instance = _make_mock_job_manager()
-        mock_jm_cls.return_value = mock_jm_instance
+            # Error path: fetch fails -> error text shown -> dismiss cleanly
+            with patch(
+                "satellite.modals.scripts.leaderboard_modal.fetch_leaderboard",
+                side_effect=OSError("Network error"),
+            ):
+                await pilot.press("2")
+                await wait_until(
+                    lambda: isinstance(app.screen, LeaderboardModal), pilot
+                )
 
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = MOCK_NONEXISTENT_PID
-        mock_popen.return_value = mock_process
+                modal = app.screen
+                assert isinstance(modal, LeaderboardModal)
+                await wait_until(lambda: modal._error is not None, pilot)
 
-        app = SatelliteApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            await pilot.pause()
-            await pilot.pause()
+                error_widget = modal.query_one("#error-text", Static)
+                assert error_widget.display is True
+                assert "Network error" in str(error_widget.content)
 
-            from satellite.screens.main import MainScreen
+                await pilot.press("escape")
+                await wait_until(lambda: isinstance(app.screen, MainScreen), pilot)
+                assert isinstance(app.screen, MainScreen)
 
+            # Rapid path: press 2 -> Escape three times in a row
             for _ in range(3):
                 assert isinstance(app.screen, MainScreen)
                 await pilot.press("2")
-                await pilot.pause()
-                await pilot.pause()
+                await wait_until(
+                    lambda: isinstance(app.screen, LeaderboardModal), pilot
+                )
                 assert isinstance(app.screen, LeaderboardModal)
                 await pilot.press("escape")
-                await pilot.pause()
+                await wait_until(lambda: isinstance(app.screen, MainScreen), pilot)
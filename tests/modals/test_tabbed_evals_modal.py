@@ -1,7 +1,10 @@
 """Tests for TabbedEvalsModal rendering and tab functionality."""
 
+import functools
+from collections.abc import Callable
 from unittest.mock import MagicMock
 
+import pytest
 from textual.app import App
 from textual.widgets import Button, Switch
 
@@ -12,6 +15,9 @@ from satellite.widgets.eval_list import EvalList
 from satellite.widgets.tab_header import TabHeader
 from satellite.widgets.tab_item import TabItem
 
+# One event loop for the whole module; each test still mounts a fresh app.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class TabbedEvalsModalTestApp(App):
     """Minimal app for testing TabbedEvalsModal in isolation."""
@@ -36,19 +42,32 @@ class TabbedEvalsModalTestApp(App):
         self.push_screen(modal)
 
 
+@pytest.fixture(scope="module")
+def app_factory() -> Callable[[], TabbedEvalsModalTestApp]:
+    """Build fresh test apps around one module-wide job manager and model config.
+
+    Every test mounts its own app because clicks and tab switches mutate the
+    modal; only the read-only collaborators are shared.
+    """
+    manager = MagicMock(spec=JobManager)
+    manager.list_jobs.return_value = []
+    manager.get_job.return_value = None
+    model_configs = [ModelConfig(provider="openai", api_key="sk-test", model="gpt-4o")]
+    return functools.partial(
+        TabbedEvalsModalTestApp,
+        model_configs=model_configs,
+        job_manager=manager,
+    )
+
+
 class TestTabbedEvalsModalRendering:
     """Tests for TabbedEvalsModal initial rendering."""
 
     async def test_modal_renders_evals_and_progress_tabs(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """TabbedEvalsModal renders with correct tabs and default state."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test():
             modal = app.screen
@@ -66,15 +85,10 @@ class TestTabbedEvalsModalTabSwitching:
     """Tests for tab switching behavior."""
 
     async def test_clicking_progress_tab_switches_active_tab(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """Clicking Progress tab switches active state."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test() as pilot:
             await pilot.pause()
@@ -96,15 +110,10 @@ class TestTabbedEvalsModalButtons:
     """Tests for button interactions."""
 
     async def test_cancel_button_dismisses_modal(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """Cancel button dismisses modal."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test() as pilot:
             assert isinstance(app.screen, TabbedEvalsModal)
@@ -117,15 +126,10 @@ class TestTabbedEvalsModalButtons:
             assert not isinstance(app.screen, TabbedEvalsModal)
 
     async def test_close_button_on_progress_tab_dismisses_modal(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """Close button on Progress tab dismisses modal."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test() as pilot:
             await pilot.pause()
@@ -144,15 +148,10 @@ class TestTabbedEvalsModalButtons:
             assert not isinstance(app.screen, TabbedEvalsModal)
 
     async def test_run_button_without_selection_keeps_modal_open(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """Run button without selected benchmarks keeps modal open."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test() as pilot:
             modal = app.screen
@@ -175,15 +174,10 @@ class TestTabbedEvalsModalSettings:
     """Tests for Settings tab widgets."""
 
     async def test_settings_tab_has_full_benchmark_switch(
-        self,
-        mock_job_manager: MagicMock,
-        sample_model_config: list[ModelConfig],
+        self, app_factory: Callable[[], TabbedEvalsModalTestApp]
     ) -> None:
         """Settings tab contains a Switch widget with id full-benchmark-switch."""
-        app = TabbedEvalsModalTestApp(
-            model_configs=sample_model_config,
-            job_manager=mock_job_manager,
-        )
+        app = app_factory()
 
         async with app.run_test() as pilot:
             await pilot.pause()
@@ -0,0 +1,43 @@
+"""Fixtures shared by the services tests."""
+
+import os
+import sys
+from collections.abc import Generator
+
+import pytest
+
+try:
+    import fcntl
+except ImportError:  # e.g. Windows; the FD guard below only runs on Linux.
+    fcntl = None
+
+# Tolerated FD growth per test (lazy imports, logging handlers, interpreter caches).
+FD_SLACK = 3
+
+
+def _open_fds() -> set[int]:
+    return {int(name) for name in os.listdir("/proc/self/fd")}
+
+
+def _inheritable(fd: int) -> bool:
+    try:
+        return not fcntl.fcntl(fd, fcntl.F_GETFD) & fcntl.FD_CLOEXEC
+    except OSError:
+        return False  # Closed since it was listed.
+
+
+@pytest.fixture(autouse=sys.platform == "linux")
+def _fd_leak_guard(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """Fail any services test that leaves file descriptors open behind it.
+
+    Descriptors that do survive must be close-on-exec, so worker and view
+    subprocesses can never inherit them.
+    """
+    baseline = _open_fds()
+    yield
+    new_fds = _open_fds() - baseline
+    leaked = len(new_fds)
+    if leaked > FD_SLACK:
+        pytest.fail(f"{request.node.nodeid} leaked {leaked} file descriptors")
+    if inheritable := sorted(fd for fd in new_fds if _inheritable(fd)):
+        pytest.fail(f"{request.node.nodeid} left inheritable FDs open: {inheritable}")
@@ -31,3 +31,12 @@ class TestGetVar:
         manager.set_var("GITHUB_TOKEN", "ghp_abc123")
         manager.delete_var("GITHUB_TOKEN")
         assert manager.get_var("GITHUB_TOKEN") == ""
+
+    def test_reflects_external_edit(
+        self, manager: EnvConfigManager, tmp_path: Path
+    ) -> None:
+        manager.set_var("GITHUB_TOKEN", "old")
+        assert manager.get_var("GITHUB_TOKEN") == "old"
+
+        (tmp_path / ".env").write_text("GITHUB_TOKEN='edited-outside'\n")
+        assert manager.get_var("GITHUB_TOKEN") == "edited-outside"
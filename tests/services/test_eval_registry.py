@@ -6,27 +6,24 @@ import pytest
 
 from satellite.services.evals import registry
 
-
-def test_get_total_samples_uses_split_specific_overrides() -> None:
-    """Known eval IDs return split-appropriate hardcoded sample counts."""
-    assert registry.get_total_samples("teleqna", full=False) == 1000
-    assert registry.get_total_samples("teleqna", full=True) == 10_000
-
-
-def test_get_total_samples_falls_back_to_discovered_config(
-    monkeypatch: pytest.MonkeyPatch,
+_CUSTOM_TABLE = {"custom_eval": SimpleNamespace(total_samples=321)}
+
+
+@pytest.mark.parametrize(
+    ("eval_id", "full", "table", "expected"),
+    [
+        pytest.param("teleqna", False, None, 1000, id="override-sample"),
+        pytest.param("teleqna", True, None, 10_000, id="override-full"),
+        pytest.param("custom_eval", False, _CUSTOM_TABLE, 321, id="discovered-sample"),
+        pytest.param("custom_eval", True, _CUSTOM_TABLE, 321, id="discovered-full"),
+        pytest.param("__missing_eval__", False, None, 0, id="unknown"),
+    ],
+)
+def test_get_total_samples(
+    eval_id: str, full: bool, table: dict | None, expected: int
 ) -> None:
-    """Unknown override IDs fall back to discovered BenchmarkConfig totals."""
-    monkeypatch.setattr(
-        registry,
-        "BENCHMARKS_BY_ID",
-        {"custom_eval": SimpleNamespace(total_samples=321)},
+    """Overrides win, then discovered BenchmarkConfig totals, then 0."""
+    assert (
+        registry.get_total_samples(eval_id, full=full, benchmarks_by_id=table)
+        == expected
     )
-
-    assert registry.get_total_samples("custom_eval", full=False) == 321
-    assert registry.get_total_samples("custom_eval", full=True) == 321
-
-
-def test_get_total_samples_returns_zero_when_unknown() -> None:
-    """Unknown eval IDs with no metadata return 0."""
-    assert registry.get_total_samples("__missing_eval__", full=False) == 0
@@ -1,6 +1,7 @@
 """Tests for EvalSettings serialization and backward compatibility."""
 
 import json
+import os
 
 import pytest
 
@@ -40,3 +41,48 @@ class TestEvalSettingsFullBenchmark:
         path.write_text(json.dumps(legacy))
 
         assert EvalSettingsManager(settings_path=path).load().full_benchmark is False
+
+
+class TestEvalSettingsCache:
+    """Tests for the (mtime, size)-keyed load() cache."""
+
+    def test_external_edit_invalidates_cache(self, tmp_path) -> None:
+        """A rewrite with a new mtime is picked up by the next load()."""
+        path = tmp_path / "eval_settings.json"
+        manager = EvalSettingsManager(settings_path=path)
+        manager.save(EvalSettings(epochs=2))
+        assert manager.load().epochs == 2
+
+        path.write_text(json.dumps({"epochs": 5}))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.load().epochs == 5
+
+    def test_same_mtime_size_change_invalidates_cache(self, tmp_path) -> None:
+        """A rewrite within one mtime tick is picked up when the size differs."""
+        path = tmp_path / "eval_settings.json"
+        manager = EvalSettingsManager(settings_path=path)
+        manager.save(EvalSettings(epochs=2))
+        stat = path.stat()
+
+        path.write_text(json.dumps({"epochs": 5}))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert manager.load().epochs == 5
+
+    def test_clear_cache_forces_reread(self, tmp_path) -> None:
+        """clear_cache() drops entries even when mtime and size are unchanged."""
+        path = tmp_path / "eval_settings.json"
+        manager = EvalSettingsManager(settings_path=path)
+        manager.save(EvalSettings(epochs=2))
+        stat = path.stat()
+
+        # Same byte length, same mtime: indistinguishable to the cache key.
+        path.write_text(path.read_text().replace('"epochs": 2', '"epochs": 7'))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert path.stat().st_size == stat.st_size
+        assert manager.load().epochs == 2
+
+        EvalSettingsManager.clear_cache()
+        assert manager.load().epochs == 7
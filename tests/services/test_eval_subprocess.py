@@ -4,9 +4,12 @@ These tests verify that eval_set() is called via subprocess to avoid
 FD pollution from Textual's async runtime.
 """
 
+import functools
 import json
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -15,182 +18,151 @@ from satellite.services.config import EvalSettings
 from satellite.services.evals.runner import EvalResult, EvalRunner
 
 
-def _make_mock_popen(returncode: int = 0, stderr: str = "") -> MagicMock:
-    """Create a mock Popen that returns the given returncode and stderr."""
-    mock_process = MagicMock()
-    mock_process.communicate.return_value = ("", stderr)
-    mock_process.returncode = returncode
-    mock_process.pid = 12345
-    mock_process.poll.return_value = None
-    return mock_process
+def _make_fake_popen(returncode: int = 0, stderr: str = "") -> SimpleNamespace:
+    """Create a fake process; the stdin sent to communicate() lands in _captured."""
+    captured: dict[str, str | None] = {}
 
+    def communicate(input: str | None = None) -> tuple[str, str]:
+        captured["input"] = input
+        return "", stderr
 
-class TestRunEvalSetSubprocess:
-    """Tests for _run_eval_set subprocess isolation."""
-
-    def test_calls_subprocess_with_correct_command(self, tmp_path: Path) -> None:
-        """Subprocess called with uv run python -m satellite.services.evals.worker."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen()
-
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
-
-            mock_popen.assert_called_once()
-            call_args = mock_popen.call_args
-            cmd = call_args[0][0]
-
-            assert cmd == ["uv", "run", "python", "-m", "satellite.services.evals.worker"]
-
-    def test_passes_config_via_stdin(self, tmp_path: Path) -> None:
-        """Config JSON passed via stdin with model, benchmarks, log_dir, and settings."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_process = _make_mock_popen()
-            mock_popen.return_value = mock_process
-            settings = EvalSettings(limit=5, epochs=2)
-
-            runner._run_eval_set("job_1", ["teleqna", "telemath"], "openai/gpt-4", log_dir, settings)
-
-            call_kwargs = mock_process.communicate.call_args[1]
-            config = json.loads(call_kwargs["input"])
-
-            assert config["model"] == "openai/gpt-4"
-            assert config["benchmarks"] == ["teleqna", "telemath"]
-            assert config["log_dir"] == str(log_dir)
-            assert config["limit"] == 5
-            assert config["epochs"] == 2
-
-    def test_returns_success_on_zero_returncode(self, tmp_path: Path) -> None:
-        """Returns EvalResult(success=True) when subprocess succeeds."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen(returncode=0)
-
-            result = runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
-
-            assert result == EvalResult(success=True)
-
-    def test_returns_cancelled_on_returncode_2(self, tmp_path: Path) -> None:
-        """Returns EvalResult with cancelled=True on returncode 2."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen(returncode=2, stderr="Cancelled")
-
-            result = runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
-
-            assert result.success is False
-            assert result.cancelled is True
+    return SimpleNamespace(
+        communicate=communicate,
+        returncode=returncode,
+        pid=12345,
+        poll=lambda: None,
+        _captured=captured,
+    )
 
-    def test_returns_error_on_nonzero_returncode(self, tmp_path: Path) -> None:
-        """Returns EvalResult with error message on failure."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
 
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen(returncode=1, stderr="API error: invalid key")
+class _RecordingPopen:
+    """Popen factory stub that records each call and returns *process*."""
 
-            result = runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
+    def __init__(self, process: SimpleNamespace) -> None:
+        self.process = process
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
 
-            assert result.success is False
-            assert result.cancelled is False
-            assert "API error: invalid key" in result.error
+    def __call__(self, *args: Any, **kwargs: Any) -> SimpleNamespace:
+        self.calls.append((args, kwargs))
+        return self.process
 
-    def test_uses_pipe_for_stdin_stdout_stderr(self, tmp_path: Path) -> None:
-        """Subprocess is called with PIPE for stdin, stdout, stderr and text=True."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
 
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen()
+RunnerEnv = tuple[Callable[..., EvalRunner], Path]
 
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
 
-            call_kwargs = mock_popen.call_args[1]
-            assert call_kwargs["text"] is True
+@pytest.fixture(scope="module")
+def eval_runner_env(tmp_path_factory: pytest.TempPathFactory) -> RunnerEnv:
+    """Shared jobs dir and log dir for the module, plus an EvalRunner builder.
 
-    def test_starts_subprocess_in_new_session(self, tmp_path: Path) -> None:
-        """Subprocess runs in its own session for process-group cancellation."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
+    The worker process is always faked, so nothing is written between tests.
+    Runners are still built per test because the Popen factory is injected
+    through the constructor.
+    """
+    jobs_dir = tmp_path_factory.mktemp("eval")
+    log_dir = jobs_dir / "logs"
+    log_dir.mkdir()
+    return functools.partial(EvalRunner, jobs_dir), log_dir
 
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen()
 
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
+def _run_once(
+    env: RunnerEnv,
+    process: SimpleNamespace,
+    settings: EvalSettings | None = None,
+    benchmarks: tuple[str, ...] = ("teleqna",),
+) -> tuple[_RecordingPopen, EvalResult]:
+    """Run _run_eval_set against *process* and return the factory and result."""
+    make_runner, log_dir = env
+    popen = _RecordingPopen(process)
+    runner = make_runner(popen_factory=popen)
+    result = runner._run_eval_set(
+        "job_1", list(benchmarks), "openai/gpt-4", log_dir, settings or EvalSettings()
+    )
+    return popen, result
 
-            call_kwargs = mock_popen.call_args[1]
-            assert call_kwargs["start_new_session"] is True
 
-    def test_uses_project_root_cwd_for_uv_resolution(self, tmp_path: Path) -> None:
-        """Worker subprocess sets cwd so uv resolves project outside caller CWD."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
+class TestRunEvalSetSubprocess:
+    """Tests for _run_eval_set subprocess isolation."""
 
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.return_value = _make_mock_popen()
+    def test_spawns_worker_with_config_on_stdin(self, eval_runner_env: RunnerEnv) -> None:
+        """One worker launch: uv command, pipes, new session, project cwd, config via stdin."""
+        _, log_dir = eval_runner_env
+        fake_process = _make_fake_popen()
+        popen, _ = _run_once(
+            eval_runner_env,
+            fake_process,
+            EvalSettings(limit=5, epochs=2),
+            ("teleqna", "telemath"),
+        )
+
+        assert len(popen.calls) == 1
+        args, kwargs = popen.calls[0]
+        assert args[0] == ["uv", "run", "python", "-m", "satellite.services.evals.worker"]
+        assert kwargs["text"] is True
+        # Own session so cancellation can signal the whole process group
+        assert kwargs["start_new_session"] is True
+        # Explicit cwd so uv resolves the project outside the caller's CWD
+        assert kwargs["cwd"] == PACKAGE_ROOT.parent.parent
+
+        config = json.loads(fake_process._captured["input"])
+        assert config["model"] == "openai/gpt-4"
+        assert config["benchmarks"] == ["teleqna", "telemath"]
+        assert config["log_dir"] == str(log_dir)
+        assert config["limit"] == 5
+        assert config["epochs"] == 2
 
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
+    @pytest.mark.parametrize(
+        ("returncode", "stderr", "success", "cancelled", "error"),
+        [
+            pytest.param(0, "", True, False, None, id="success"),
+            pytest.param(2, "Cancelled", False, True, "Cancelled", id="cancelled"),
+            pytest.param(
+                1,
+                "API error: invalid key",
+                False,
+                False,
+                "API error: invalid key",
+                id="failure",
+            ),
+        ],
+    )
+    def test_result_reflects_returncode(
+        self,
+        eval_runner_env: RunnerEnv,
+        returncode: int,
+        stderr: str,
+        success: bool,
+        cancelled: bool,
+        error: str | None,
+    ) -> None:
+        """Exit code 0 succeeds, 2 means cancelled, anything else surfaces stderr."""
+        _, result = _run_once(eval_runner_env, _make_fake_popen(returncode, stderr))
 
-            call_kwargs = mock_popen.call_args[1]
-            assert call_kwargs["cwd"] == PACKAGE_ROOT.parent.parent
+        assert result == EvalResult(success=success, error=error, cancelled=cancelled)
 
     def test_default_settings_have_no_limit(self) -> None:
         """EvalSettings() defaults to limit=None (run all samples)."""
         settings = EvalSettings()
         assert settings.limit is None
 
-    def test_omits_limit_when_none(self, tmp_path: Path) -> None:
+    def test_omits_limit_when_none(self, eval_runner_env: RunnerEnv) -> None:
         """Config JSON omits limit key when settings.limit is None."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_process = _make_mock_popen()
-            mock_popen.return_value = mock_process
-
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
+        fake_process = _make_fake_popen()
+        _run_once(eval_runner_env, fake_process)
 
-            call_kwargs = mock_process.communicate.call_args[1]
-            config = json.loads(call_kwargs["input"])
+        config = json.loads(fake_process._captured["input"])
 
-            assert "limit" not in config
-            assert config["epochs"] == 1
-            assert config["max_connections"] == 10
+        assert "limit" not in config
+        assert config["epochs"] == 1
+        assert config["max_connections"] == 10
 
-    def test_includes_limit_zero_in_config(self, tmp_path: Path) -> None:
+    def test_includes_limit_zero_in_config(self, eval_runner_env: RunnerEnv) -> None:
         """Config JSON includes limit=0 when settings.limit is 0 (not silently dropped)."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_process = _make_mock_popen()
-            mock_popen.return_value = mock_process
-
-            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings(limit=0))
+        fake_process = _make_fake_popen()
+        _run_once(eval_runner_env, fake_process, EvalSettings(limit=0))
 
-            call_kwargs = mock_process.communicate.call_args[1]
-            config = json.loads(call_kwargs["input"])
+        config = json.loads(fake_process._captured["input"])
 
-            assert config["limit"] == 0
+        assert config["limit"] == 0
 
     @pytest.mark.parametrize(
         ("full_benchmark", "expected_key", "expected_value"),
@@ -203,44 +175,30 @@ class TestRunEvalSetSubprocess:
     )
     def test_full_benchmark_config_serialization(
         self,
-        tmp_path: Path,
+        eval_runner_env: RunnerEnv,
         full_benchmark: bool,
         expected_key: str,
         expected_value: bool | None,
     ) -> None:
         """Config JSON includes full_benchmark only when True."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
-
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_process = _make_mock_popen()
-            mock_popen.return_value = mock_process
-
-            runner._run_eval_set(
-                "job_1",
-                ["teleqna"],
-                "openai/gpt-4",
-                log_dir,
-                EvalSettings(full_benchmark=full_benchmark),
-            )
-
-            call_kwargs = mock_process.communicate.call_args[1]
-            config = json.loads(call_kwargs["input"])
-
-            if expected_value is None:
-                assert expected_key not in config
-            else:
-                assert config[expected_key] is expected_value
-
-    def test_propagates_subprocess_exception(self, tmp_path: Path) -> None:
+        fake_process = _make_fake_popen()
+        _run_once(eval_runner_env, fake_process, EvalSettings(full_benchmark=full_benchmark))
+
+        config = json.loads(fake_process._captured["input"])
+
+        if expected_value is None:
+            assert expected_key not in config
+        else:
+            assert config[expected_key] is expected_value
+
+    def test_propagates_subprocess_exception(self, eval_runner_env: RunnerEnv) -> None:
         """FileNotFoundError propagates when subprocess binary not found (fail fast)."""
-        log_dir = tmp_path / "logs"
-        log_dir.mkdir()
-        runner = EvalRunner(tmp_path)
+        make_runner, log_dir = eval_runner_env
 
-        with patch("satellite.services.evals.runner.subprocess.Popen") as mock_popen:
-            mock_popen.side_effect = FileNotFoundError("uv not found")
+        def popen(*args: Any, **kwargs: Any) -> SimpleNamespace:
+            raise FileNotFoundError("uv not found")
 
-            with pytest.raises(FileNotFoundError, match="uv not found"):
-                runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
+        runner = make_runner(popen_factory=popen)
+
+        with pytest.raises(FileNotFoundError, match="uv not found"):
+            runner._run_eval_set("job_1", ["teleqna"], "openai/gpt-4", log_dir, EvalSettings())
@@ -8,7 +8,10 @@ from satellite.services.evals import worker
 
 
 class _FakeTask:
-    """Minimal task type for runtime type-check tests."""
+    """Minimal task type for runtime type-check tests; remembers its kwargs."""
+
+    def __init__(self, **kwargs: bool) -> None:
+        self.kwargs = kwargs
 
 
 def _configure_task(monkeypatch: pytest.MonkeyPatch, task_fn) -> None:
@@ -18,97 +21,85 @@ def _configure_task(monkeypatch: pytest.MonkeyPatch, task_fn) -> None:
         module_path="evals.fake.fake",
         function_name="task_factory",
     )
+    monkeypatch.setattr(worker, "Task", _FakeTask)
     monkeypatch.setattr(worker, "BENCHMARKS_BY_ID", {"fake": benchmark})
     monkeypatch.setattr(worker, "import_module", lambda _: module)
 
 
-def test_load_task_passes_full_keyword_when_supported(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """load_task(full=True) forwards full=True to compatible factories."""
-    monkeypatch.setattr(worker, "Task", _FakeTask)
-    calls: list[bool] = []
+def _full_keyword_factory(*, full: bool = False) -> _FakeTask:
+    return _FakeTask(full=full)
 
-    def task_factory(*, full: bool = False):
-        calls.append(full)
-        return _FakeTask()
 
-    _configure_task(monkeypatch, task_factory)
+def _no_args_factory() -> _FakeTask:
+    return _FakeTask()
 
-    assert worker.load_task("fake", full=True) is not None
-    assert calls == [True]
 
+def _var_keyword_factory(**kwargs: bool) -> _FakeTask:
+    return _FakeTask(**kwargs)
 
-def test_load_task_omits_full_keyword_when_unsupported(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Factories without a full argument are called without keyword args."""
-    monkeypatch.setattr(worker, "Task", _FakeTask)
-    calls: list[None] = []
-
-    def task_factory():
-        calls.append(None)
-        return _FakeTask()
-
-    _configure_task(monkeypatch, task_factory)
-
-    assert worker.load_task("fake", full=True) is not None
-    assert calls == [None]
-
-
-def test_load_task_does_not_swallow_type_error(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """TypeErrors raised by compatible task factories propagate to caller."""
 
+def _raise(exc: Exception):
     def task_factory(*, full: bool = False):
-        raise TypeError("task internals failed")
-
-    _configure_task(monkeypatch, task_factory)
+        raise exc
 
-    with pytest.raises(TypeError, match="task internals failed"):
-        worker.load_task("fake", full=True)
+    return task_factory
 
 
-def test_load_task_raises_on_non_task_return(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Factories must return Task instances."""
-    monkeypatch.setattr(worker, "Task", _FakeTask)
-
-    def task_factory():
-        return object()
-
-    _configure_task(monkeypatch, task_factory)
-
-    with pytest.raises(TypeError, match="expected inspect_ai.Task"):
-        worker.load_task("fake")
-
-
-def test_load_task_propagates_non_type_error(
-    monkeypatch: pytest.MonkeyPatch,
+@pytest.mark.parametrize(
+    ("task_fn", "expected_kwargs"),
+    [
+        pytest.param(_full_keyword_factory, {"full": True}, id="full-keyword"),
+        pytest.param(_no_args_factory, {}, id="no-full-argument"),
+        pytest.param(_var_keyword_factory, {"full": True}, id="var-keyword"),
+    ],
+)
+def test_load_task_forwards_full_only_when_supported(
+    monkeypatch: pytest.MonkeyPatch, task_fn, expected_kwargs: dict[str, bool]
 ) -> None:
-    """Factory exceptions other than TypeError should propagate."""
-
-    def task_factory(*, full: bool = False):
-        raise RuntimeError("task execution failed")
-
-    _configure_task(monkeypatch, task_factory)
-
-    with pytest.raises(RuntimeError, match="task execution failed"):
-        worker.load_task("fake", full=True)
-
-
-def test_load_task_passes_full_keyword_to_var_keyword_factory(
+    """load_task(full=True) passes full=True only to factories that accept it."""
+    _configure_task(monkeypatch, task_fn)
+
+    task = worker.load_task("fake", full=True)
+
+    assert isinstance(task, _FakeTask)
+    assert task.kwargs == expected_kwargs
+
+
+@pytest.mark.parametrize(
+    ("task_fn", "full", "exc_type", "match"),
+    [
+        pytest.param(
+            _raise(TypeError("task internals failed")),
+            True,
+            TypeError,
+            "task internals failed",
+            id="type-error-not-swallowed",
+        ),
+        pytest.param(
+            _raise(RuntimeError("task execution failed")),
+            True,
+            RuntimeError,
+            "task execution failed",
+            id="other-error-propagates",
+        ),
+        pytest.param(
+            lambda: object(),
+            False,
+            TypeError,
+            "expected inspect_ai.Task",
+            id="non-task-return",
+        ),
+    ],
+)
+def test_load_task_raises(
     monkeypatch: pytest.MonkeyPatch,
+    task_fn,
+    full: bool,
+    exc_type: type[Exception],
+    match: str,
 ) -> None:
-    """Factories with **kwargs accept the full parameter."""
-    monkeypatch.setattr(worker, "Task", _FakeTask)
-    calls: list[dict[str, bool]] = []
-
-    def task_factory(**kwargs):
-        calls.append(kwargs)
-        return _FakeTask()
-
-    _configure_task(monkeypatch, task_factory)
+    """Factory errors propagate and non-Task results are rejected."""
+    _configure_task(monkeypatch, task_fn)
 
-    assert worker.load_task("fake", full=True) is not None
-    assert calls == [{"full": True}]
+    with pytest.raises(exc_type, match=match):
+        worker.load_task("fake", full=full)
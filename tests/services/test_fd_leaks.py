@@ -1,6 +1,6 @@
 """Tests for file descriptor leaks in satellite services.
 
-Verifies that subprocess DEVNULL usage, JobManager rglob, and
+Verifies that subprocess DEVNULL usage, directory walks, and
 read_eval_log calls do not accumulate leaked file descriptors.
 
 Run with: uv run pytest tests/services/test_fd_leaks.py -v
@@ -8,13 +8,96 @@ Run with: uv run pytest tests/services/test_fd_leaks.py -v
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import itertools
+import os
 import subprocess
-from collections.abc import Callable
+from collections.abc import Callable, Generator, Iterator
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from satellite import PACKAGE_ROOT
+from satellite.app import SatelliteApp
+from satellite.services.evals import JobManager
+
+
+@pytest.fixture
+def satellite_app() -> Generator[SatelliteApp, None, None]:
+    """SatelliteApp with MainScreen patched out and timers stubbed."""
+    with patch("satellite.app.MainScreen"):
+        app = SatelliteApp()
+        app.set_timer = MagicMock()
+        yield app
+    # Drop the fake view process: the next SatelliteApp() stops the previous
+    # instance's process, and a MagicMock pid would resolve to a real pgid.
+    app._view_process = None
+
+
+EVAL_SET_JSON = b'{"tasks": [{"name": "teleqna", "model": "openai/gpt-4o"}]}'
+
+
+def _write_at(dir_fd: int, name: str, payload: bytes = b"{}") -> None:
+    """Create *name* relative to an already-open directory descriptor."""
+    fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _walk_txt(root: str | os.PathLike[str]) -> Iterator[str]:
+    """Yield ``*.txt`` paths under *root*, depth first, one scandir at a time."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_txt(entry.path)
+            elif entry.name.endswith(".txt"):
+                yield entry.path
+
+
+def _fake_view_process() -> SimpleNamespace:
+    """Running view process stand-in; DEVNULL means no stdout/stderr pipes."""
+    return SimpleNamespace(
+        pid=99999,
+        poll=lambda: None,
+        wait=lambda timeout=None: 0,
+        stdout=None,
+        stderr=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def jobs_tree(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Return a builder for fake jobs dirs; each shape is built once per session.
+
+    The trees are only ever listed, never written, so tests can share them.
+    Session scope is per xdist worker; all its users live in this file, so
+    ``make test-services`` (--dist=loadfile) builds each shape only once.
+    """
+
+    @functools.cache
+    def build(
+        num_jobs: int, logs_per_dir: int, providers: tuple[str, ...] = ("openai",)
+    ) -> Path:
+        jobs_dir = tmp_path_factory.mktemp("jobs")
+        for job_num in range(1, num_jobs + 1):
+            for provider in providers:
+                job_dir = jobs_dir / f"job_{job_num}" / provider / "gpt-4o"
+                job_dir.mkdir(parents=True)
+                dir_fd = os.open(job_dir, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    _write_at(dir_fd, "eval-set.json", EVAL_SET_JSON)
+                    for i in range(logs_per_dir):
+                        _write_at(dir_fd, f"2024-01-01T00-00-0{i}Z_teleqna_x{i}.json")
+                finally:
+                    os.close(dir_fd)
+        (jobs_dir / "counter.txt").write_text(str(num_jobs + 1))
+        return jobs_dir
+
+    return build
 
 
 class TestAppViewProcessPipeFdLeak:
@@ -23,37 +106,29 @@ class TestAppViewProcessPipeFdLeak:
     def test_launch_view_uses_devnull(
         self,
         mock_popen: tuple[MagicMock, MagicMock],
+        satellite_app: SatelliteApp,
         tmp_path: Path,
     ) -> None:
         """_launch_view() uses DEVNULL for stdin/stdout/stderr."""
         popen_mock, process = mock_popen
 
-        with patch("satellite.app.MainScreen"):
-            from satellite.app import SatelliteApp
-
-            app = SatelliteApp()
-            app.set_timer = MagicMock()
-            app._launch_view(tmp_path)
+        satellite_app._launch_view(tmp_path)
 
         call_kwargs = popen_mock.call_args[1]
-        assert call_kwargs["stdout"] == subprocess.DEVNULL
-        assert call_kwargs["stderr"] == subprocess.DEVNULL
-        assert call_kwargs["stdin"] == subprocess.DEVNULL
+        assert call_kwargs["stdout"] is subprocess.DEVNULL
+        assert call_kwargs["stderr"] is subprocess.DEVNULL
+        assert call_kwargs["stdin"] is subprocess.DEVNULL
 
     def test_launch_view_uses_start_new_session(
         self,
         mock_popen: tuple[MagicMock, MagicMock],
+        satellite_app: SatelliteApp,
         tmp_path: Path,
     ) -> None:
         """_launch_view() should isolate subprocess from Textual's terminal."""
         popen_mock, process = mock_popen
 
-        with patch("satellite.app.MainScreen"):
-            from satellite.app import SatelliteApp
-
-            app = SatelliteApp()
-            app.set_timer = MagicMock()
-            app._launch_view(tmp_path)
+        satellite_app._launch_view(tmp_path)
 
         call_kwargs = popen_mock.call_args[1]
         assert call_kwargs["start_new_session"] is True
@@ -61,6 +136,7 @@ class TestAppViewProcessPipeFdLeak:
     def test_launch_view_uses_project_root_cwd(
         self,
         mock_popen: tuple[MagicMock, MagicMock],
+        satellite_app: SatelliteApp,
         tmp_path: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
@@ -68,18 +144,14 @@ class TestAppViewProcessPipeFdLeak:
         popen_mock, _ = mock_popen
         monkeypatch.chdir(tmp_path)
 
-        with patch("satellite.app.MainScreen"):
-            from satellite.app import SatelliteApp
-
-            app = SatelliteApp()
-            app.set_timer = MagicMock()
-            app._launch_view(tmp_path)
+        satellite_app._launch_view(tmp_path)
 
         call_kwargs = popen_mock.call_args[1]
         assert call_kwargs["cwd"] == PACKAGE_ROOT.parent.parent
 
     def test_repeated_launches_no_fd_leak(
         self,
+        satellite_app: SatelliteApp,
         tmp_path: Path,
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
@@ -87,22 +159,14 @@ class TestAppViewProcessPipeFdLeak:
         count_fds, _ = fd_counter
         baseline_fds = count_fds()
 
+        app = satellite_app
         with patch("satellite.app.subprocess.Popen") as popen_mock, \
-             patch("satellite.app.MainScreen"), \
              patch("satellite.app.os.killpg"), \
              patch("satellite.app.os.getpgid", return_value=99999):
-            from satellite.app import SatelliteApp
-
-            app = SatelliteApp()
-            app.set_timer = MagicMock()
+            # One running stand-in serves every launch; nothing mutates it.
+            popen_mock.return_value = _fake_view_process()
 
             for i in range(10):
-                process = MagicMock()
-                process.poll.return_value = None
-                process.stdout = None  # DEVNULL produces no pipe
-                process.stderr = None
-                popen_mock.return_value = process
-
                 log_dir = tmp_path / f"logs_{i}"
                 log_dir.mkdir(exist_ok=True)
                 app._launch_view(log_dir)
@@ -121,33 +185,12 @@ class TestJobManagerFdAccumulation:
 
     def test_list_jobs_with_real_read_eval_log_leaks_fds(
         self,
-        tmp_path: Path,
+        jobs_tree: Callable[..., Path],
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
         """Repeated list_jobs() calls do not leak FDs via read_eval_log()."""
-        from satellite.services.evals import JobManager
-
         count_fds, _ = fd_counter
-
-        jobs_dir = tmp_path / "jobs"
-        jobs_dir.mkdir()
-
-        for job_num in range(1, 6):
-            job_dir = jobs_dir / f"job_{job_num}" / "openai" / "gpt-4o"
-            job_dir.mkdir(parents=True)
-            (job_dir / "eval-set.json").write_text(
-                '{"tasks": [{"name": "teleqna", "model": "openai/gpt-4o"}]}'
-            )
-            # Create log files that will trigger read_eval_log
-            for i in range(3):
-                (job_dir / f"2024-01-01T00-00-0{i}Z_teleqna_abc{i}.json").write_text(
-                    "{}"
-                )
-
-        (jobs_dir / "counter.txt").write_text("6")
-
-        manager = JobManager()
-        manager._jobs_dir = jobs_dir
+        manager = JobManager(jobs_tree(5, 3))
 
         baseline_fds = count_fds()
 
@@ -163,37 +206,41 @@ class TestJobManagerFdAccumulation:
             f"Fix: Ensure read_eval_log() file handles are properly closed."
         )
 
-    def test_rglob_iterator_leaks_fds_when_not_exhausted(
+    def test_partial_scandir_walk_does_not_leak_fds(
         self,
         tmp_path: Path,
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
-        """Partial rglob() iteration does not leak directory handles."""
+        """Abandoning a scandir-based walk early does not leak directory handles."""
         count_fds, _ = fd_counter
 
         base_dir = tmp_path / "deep"
         for i in range(10):
             for j in range(10):
-                d = base_dir / f"level1_{i}" / f"level2_{j}"
-                d.mkdir(parents=True)
-                (d / "file.txt").write_text("test")
+                leaf = os.path.join(base_dir, f"level1_{i}", f"level2_{j}")
+                os.makedirs(leaf)
+                dir_fd = os.open(leaf, os.O_RDONLY)
+                try:
+                    _write_at(dir_fd, "file.txt", b"test")
+                finally:
+                    os.close(dir_fd)
 
         baseline_fds = count_fds()
 
-        # Break early to leave iterator unconsumed
+        # Stop after a few entries; closing() finalises the generator so its
+        # open scandir handles are released without waiting for GC.
         for _ in range(20):
-            iterator = base_dir.rglob("*.txt")
-            for idx, _ in enumerate(iterator):
-                if idx >= 5:
-                    break
+            with contextlib.closing(_walk_txt(base_dir)) as walk:
+                for _ in itertools.islice(walk, 5):
+                    pass
 
         final_fds = count_fds()
         fd_increase = final_fds - baseline_fds
 
         assert fd_increase <= 3, (
-            f"Partial rglob() iteration leaked {fd_increase} FDs. "
+            f"Partial scandir walk leaked {fd_increase} FDs. "
             f"Baseline: {baseline_fds}, Final: {final_fds}. "
-            f"Fix: Always wrap rglob() in list() or use context manager pattern."
+            f"Fix: Open os.scandir() with a context manager."
         )
 
     @pytest.mark.parametrize(
@@ -206,32 +253,14 @@ class TestJobManagerFdAccumulation:
     )
     def test_fd_usage_scales_constant_not_linear(
         self,
-        tmp_path: Path,
+        jobs_tree: Callable[..., Path],
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
         num_jobs: int,
         expected_max_fd_increase: int,
     ) -> None:
         """FD usage is O(1), not O(n) with number of jobs."""
-        from satellite.services.evals import JobManager
-
         count_fds, _ = fd_counter
-
-        jobs_dir = tmp_path / "jobs"
-        jobs_dir.mkdir()
-
-        for job_num in range(1, num_jobs + 1):
-            job_dir = jobs_dir / f"job_{job_num}" / "openai" / "gpt-4o"
-            job_dir.mkdir(parents=True)
-            (job_dir / "eval-set.json").write_text(
-                '{"tasks": [{"name": "teleqna", "model": "openai/gpt-4o"}]}'
-            )
-            for i in range(2):
-                (job_dir / f"2024-01-01T00-00-0{i}Z_teleqna_x{i}.json").write_text("{}")
-
-        (jobs_dir / "counter.txt").write_text(str(num_jobs + 1))
-
-        manager = JobManager()
-        manager._jobs_dir = jobs_dir
+        manager = JobManager(jobs_tree(num_jobs, 2))
 
         baseline_fds = count_fds()
 
@@ -253,45 +282,25 @@ class TestFdStressScenarios:
 
     def test_combined_operations_with_devnull(
         self,
-        tmp_path: Path,
+        satellite_app: SatelliteApp,
+        jobs_tree: Callable[..., Path],
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
         """Combined JobManager and view process usage stays under 10% of FD limit."""
-        from satellite.services.evals import JobManager
-
         count_fds, get_limit = fd_counter
-
-        jobs_dir = tmp_path / "jobs"
-        jobs_dir.mkdir()
-        for job_num in range(1, 6):
-            job_dir = jobs_dir / f"job_{job_num}" / "openai" / "gpt-4o"
-            job_dir.mkdir(parents=True)
-            (job_dir / "eval-set.json").write_text(
-                '{"tasks": [{"name": "teleqna", "model": "openai/gpt-4o"}]}'
-            )
-        (jobs_dir / "counter.txt").write_text("6")
-
-        manager = JobManager()
-        manager._jobs_dir = jobs_dir
+        jobs_dir = jobs_tree(5, 3)
+        manager = JobManager(jobs_dir)
 
         fd_limit = get_limit()
 
+        app = satellite_app
         with patch("satellite.app.subprocess.Popen") as popen_mock, \
-             patch("satellite.app.MainScreen"), \
              patch("satellite.app.os.killpg"), \
              patch("satellite.app.os.getpgid", return_value=99999):
-            from satellite.app import SatelliteApp
 
-            app = SatelliteApp()
-            app.set_timer = MagicMock()
+            popen_mock.return_value = _fake_view_process()
 
             for i in range(15):
-                process = MagicMock()
-                process.poll.return_value = None
-                process.stdout = None  # DEVNULL produces no pipe
-                process.stderr = None
-                popen_mock.return_value = process
-
                 _ = manager.list_jobs()
                 app._launch_view(jobs_dir / f"job_{(i % 5) + 1}")
 
@@ -306,34 +315,15 @@ class TestFdStressScenarios:
             f"Fix: Address JobManager FD leaks."
         )
 
+    @pytest.mark.slow
     def test_heavy_load_with_real_file_operations(
         self,
-        tmp_path: Path,
+        jobs_tree: Callable[..., Path],
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
         """Heavy load with real file operations stays under 30% of FD limit."""
-        from satellite.services.evals import JobManager
-
         count_fds, get_limit = fd_counter
-
-        jobs_dir = tmp_path / "jobs"
-
-        for job_num in range(1, 21):
-            for provider in ["openai", "anthropic", "google"]:
-                job_dir = jobs_dir / f"job_{job_num}" / provider / "model"
-                job_dir.mkdir(parents=True)
-                (job_dir / "eval-set.json").write_text(
-                    '{"tasks": [{"name": "test", "model": "test"}]}'
-                )
-                for i in range(5):
-                    (job_dir / f"2024-01-01T00-00-0{i}Z_test_abc{i}.json").write_text(
-                        "{}"
-                    )
-
-        (jobs_dir / "counter.txt").write_text("21")
-
-        manager = JobManager()
-        manager._jobs_dir = jobs_dir
+        manager = JobManager(jobs_tree(20, 5, ("openai", "anthropic", "google")))
 
         fd_limit = get_limit()
 
@@ -349,33 +339,28 @@ class TestFdStressScenarios:
             f"Fix: Implement explicit FD cleanup after processing."
         )
 
+    @pytest.mark.slow
     def test_no_emfile_error_under_stress(
         self,
-        tmp_path: Path,
+        jobs_tree: Callable[..., Path],
         fd_counter: tuple[Callable[[], int], Callable[[], int]],
     ) -> None:
         """Stress test does not trigger EMFILE (too many open files)."""
-        from satellite.services.evals import JobManager
-
-        jobs_dir = tmp_path / "jobs"
-
-        for job_num in range(1, 16):
-            job_dir = jobs_dir / f"job_{job_num}" / "openai" / "gpt-4o"
-            job_dir.mkdir(parents=True)
-            (job_dir / "eval-set.json").write_text(
-                '{"tasks": [{"name": "teleqna", "model": "openai/gpt-4o"}]}'
-            )
-            for i in range(5):
-                (job_dir / f"2024-01-01T00-00-0{i}Z_teleqna_x{i}.json").write_text("{}")
-
-        (jobs_dir / "counter.txt").write_text("16")
-
-        manager = JobManager()
-        manager._jobs_dir = jobs_dir
+        count_fds, _ = fd_counter
+        manager = JobManager(jobs_tree(15, 5))
 
+        # A leak would grow the FD count every call; once it has stayed flat
+        # for a while, further iterations cannot reach EMFILE.
+        stable_calls = 0
+        previous_fds = count_fds()
         try:
-            for _ in range(100):
+            for i in range(100):
                 _ = manager.list_jobs()
+                current_fds = count_fds()
+                stable_calls = stable_calls + 1 if current_fds == previous_fds else 0
+                previous_fds = current_fds
+                if stable_calls >= 10 and i >= 20:
+                    break
         except OSError as e:
             if e.errno == 24:  # EMFILE - too many open files
                 pytest.fail(
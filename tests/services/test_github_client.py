@@ -6,6 +6,22 @@ import pytest
 
 from satellite.services.submit.submit import GitHubClient, GitHubError
 
+# Git Data API replies for a single-file upload, in request order.
+UPLOAD_RESPONSES = (
+    # GET ref
+    {"object": {"sha": "base-sha"}},
+    # GET commit
+    {"tree": {"sha": "tree-sha"}},
+    # POST blob (file 1)
+    {"sha": "blob-sha-1"},
+    # POST tree
+    {"sha": "new-tree-sha"},
+    # POST commit
+    {"sha": "new-commit-sha"},
+    # PATCH ref
+    {},
+)
+
 
 @pytest.fixture
 def mock_client() -> GitHubClient:
@@ -84,22 +100,8 @@ class TestUploadFiles:
     def test_upload_creates_blobs_and_commit(
         self, mock_client: GitHubClient
     ) -> None:
-        responses = [
-            # GET ref
-            {"object": {"sha": "base-sha"}},
-            # GET commit
-            {"tree": {"sha": "tree-sha"}},
-            # POST blob (file 1)
-            {"sha": "blob-sha-1"},
-            # POST tree
-            {"sha": "new-tree-sha"},
-            # POST commit
-            {"sha": "new-commit-sha"},
-            # PATCH ref
-            {},
-        ]
         with patch.object(
-            mock_client, "_request", side_effect=responses
+            mock_client, "_request", side_effect=UPLOAD_RESPONSES
         ) as mock_req:
             result = mock_client.upload_files(
                 "testuser/leaderboard",
@@ -107,7 +109,7 @@ class TestUploadFiles:
                 [("trajectories/model/file.json", b'{"data": true}')],
             )
             assert result == "new-commit-sha"
-            assert mock_req.call_count == 6
+            assert mock_req.call_count == len(UPLOAD_RESPONSES)
 
 
 class TestCreatePR:
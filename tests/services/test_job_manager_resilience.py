@@ -1,14 +1,20 @@
 """Tests for JobManager resilience when jobs folder is deleted at runtime."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
 from satellite.services.evals import JobManager
+from satellite.services.evals import job_manager as job_manager_module
 from satellite.services.evals.job_manager import (
     _aggregate_progress,
+    _find_eval_set_files,
     _load_job_results,
+    _read_eval_log_header_safe,
 )
 
 
@@ -35,6 +41,51 @@ class TestJobManagerFolderDeletion:
         result = list(manager.job_dirs())
         assert result == []
 
+    def test_job_dirs_tolerates_deletion_after_mkdir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """job_dirs() returns [] if the folder vanishes between mkdir and scan."""
+        manager = JobManager(jobs_dir=tmp_path / "jobs")
+
+        def scandir(path: Path) -> None:
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr("satellite.services.evals.job_manager.os.scandir", scandir)
+
+        assert manager.job_dirs() == []
+
+    def test_list_jobs_concurrent_load_keeps_order_and_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Jobs loaded on the pool sort as before; a load_job error propagates."""
+        jobs_dir = tmp_path / "jobs"
+        for i in range(6):
+            (jobs_dir / f"job_{i}").mkdir(parents=True)
+
+        def fake_load_job(self: JobManager, job_dir: Path) -> SimpleNamespace:
+            i = int(job_dir.name.rsplit("_", 1)[1])
+            return SimpleNamespace(
+                id=job_dir.name,
+                status="running" if i == 1 else "success",
+                created_at=datetime.fromtimestamp(1_000 + i),
+            )
+
+        monkeypatch.setattr(JobManager, "load_job", fake_load_job)
+        manager = JobManager(jobs_dir=jobs_dir)
+
+        ids = [job.id for job in manager.list_jobs()]
+        assert ids == ["job_1", "job_5", "job_4", "job_3", "job_2", "job_0"]
+        assert [job.id for job in manager.list_jobs(limit=2)] == ids[:2]
+
+        def failing_load_job(self: JobManager, job_dir: Path) -> SimpleNamespace:
+            if job_dir.name == "job_3":
+                raise OSError("disk gone")
+            return fake_load_job(self, job_dir)
+
+        monkeypatch.setattr(JobManager, "load_job", failing_load_job)
+        with pytest.raises(OSError, match="disk gone"):
+            manager.list_jobs()
+
     def test_list_jobs_recovers_when_folder_deleted(self, tmp_path: Path) -> None:
         """list_jobs() should return empty list if folder deleted, not crash."""
         jobs_dir = tmp_path / "jobs"
@@ -73,6 +124,28 @@ class TestJobManagerFolderDeletion:
         assert jobs_dir.exists()
 
 
+class TestFindEvalSetFiles:
+    """Tests for the scandir-based eval-set.json walk."""
+
+    def test_finds_nested_eval_sets_and_tolerates_missing_dir(
+        self, tmp_path: Path
+    ) -> None:
+        """Nested model dirs (e.g. "openai/gpt-4") are walked; a missing dir yields []."""
+        nested = tmp_path / "openai" / "gpt-4"
+        nested.mkdir(parents=True)
+        (nested / "eval-set.json").write_text("{}")
+        (tmp_path / "anthropic").mkdir()
+        (tmp_path / "anthropic" / "eval-set.json").write_text("{}")
+        (tmp_path / "anthropic" / "other.json").write_text("{}")
+
+        found = _find_eval_set_files(tmp_path)
+
+        assert sorted(found) == sorted(
+            [nested / "eval-set.json", tmp_path / "anthropic" / "eval-set.json"]
+        )
+        assert _find_eval_set_files(tmp_path / "missing") == []
+
+
 class TestJobManagerInProgressLogs:
     """Tests that in-progress/unreadable logs do not crash polling paths."""
 
@@ -144,3 +217,73 @@ class TestJobManagerInProgressLogs:
         )
 
         assert _aggregate_progress([model_dir]) == ("running", 0, 0, 0.0, 0, 0)
+
+
+class TestEvalLogHeaderCache:
+    """Tests that finished log headers are parsed once per (mtime, size)."""
+
+    def _count_reads(self, monkeypatch: pytest.MonkeyPatch, status: str) -> list[object]:
+        reads: list[object] = []
+
+        def fake_read(log_path: object, header_only: bool = False) -> SimpleNamespace:
+            reads.append(log_path)
+            return SimpleNamespace(status=status)
+
+        monkeypatch.setattr(
+            "satellite.services.evals.job_manager.read_eval_log", fake_read
+        )
+        return reads
+
+    def test_finished_log_read_once_until_it_changes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A finished log is re-read only after its mtime or size changes."""
+        reads = self._count_reads(monkeypatch, "success")
+        name = (tmp_path / "finished.json").as_uri()
+        ref = SimpleNamespace(name=name, mtime=1.0, size=10)
+
+        first = _read_eval_log_header_safe(ref)
+        assert _read_eval_log_header_safe(ref) is first
+        assert len(reads) == 1
+
+        _read_eval_log_header_safe(SimpleNamespace(name=name, mtime=2.0, size=10))
+        assert len(reads) == 2
+
+    def test_concurrent_reads_with_full_cache(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Threads inserting into a full cache evict without corrupting it."""
+        self._count_reads(monkeypatch, "success")
+        cache: dict = {}
+        monkeypatch.setattr(job_manager_module, "_HEADER_CACHE", cache)
+        monkeypatch.setattr(job_manager_module, "_HEADER_CACHE_MAX", 8)
+        refs = [
+            SimpleNamespace(name=(tmp_path / f"{i}.json").as_uri(), mtime=1.0, size=10)
+            for i in range(20_000)
+        ]
+
+        # Switch threads as often as possible so unguarded eviction would race.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                logs = list(pool.map(_read_eval_log_header_safe, refs))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert all(log is not None for log in logs)
+        assert len(cache) == 8
+
+    def test_started_log_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Logs still being written are read on every poll."""
+        reads = self._count_reads(monkeypatch, "started")
+        ref = SimpleNamespace(
+            name=(tmp_path / "running.json").as_uri(), mtime=1.0, size=10
+        )
+
+        _read_eval_log_header_safe(ref)
+        _read_eval_log_header_safe(ref)
+
+        assert len(reads) == 2
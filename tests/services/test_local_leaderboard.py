@@ -25,11 +25,13 @@ class FakeJobManager:
     ) -> None:
         self._jobs = jobs
         self._results = results
+        self.results_requested: list[str] = []
 
     def list_jobs(self) -> list[Job]:
         return self._jobs
 
     def get_job_results(self, job_id: str) -> dict[str, dict[str, float]]:
+        self.results_requested.append(job_id)
         return self._results.get(job_id, {})
 
 
@@ -156,6 +158,8 @@ class TestCollectLocalEntries:
 
         assert len(entries) == 1
         assert entries[0].avg_score == pytest.approx(95.0)
+        # The older job has no unseen models, so its logs are never read.
+        assert mgr.results_requested == ["j_new"]
 
     @patch(
         "satellite.services.leaderboard.client.BENCHMARKS_BY_ID",
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from datetime import date
 from pathlib import Path
-from unittest.mock import patch
 
 import pyarrow as pa
 import pyarrow.parquet as pq
@@ -137,65 +136,61 @@ def _make_preview(
     )
 
 
-@pytest.fixture()
-def _mock_logs() -> object:
-    """Patch read_eval_log to return pre-built mock logs."""
-    with patch(MOCK_PATCH_TARGET, side_effect=_mock_read_eval_log) as mock:
-        yield mock
-
-
 def _read_parquet(parquet_bytes: bytes) -> pa.Table:
     return pq.read_table(pa.BufferReader(parquet_bytes))
 
 
+BuiltParquet = tuple[str, pa.Table]
+
+
+@pytest.fixture(scope="class")
+def built_parquet() -> BuiltParquet:
+    """Build the default model card once per class from the pre-built mock logs.
+
+    Tests only read the returned remote path and table.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MOCK_PATCH_TARGET, _mock_read_eval_log)
+        remote_path, parquet_bytes = build_model_card_parquet(_make_preview())
+    return remote_path, _read_parquet(parquet_bytes)
+
+
 # -- Tests -----------------------------------------------------------------
 
 
-@pytest.mark.usefixtures("_mock_logs")
 class TestParquetSchema:
     """Verify the output parquet matches the leaderboard schema."""
 
-    def test_has_required_columns(self) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
+    def test_has_required_columns(self, built_parquet: BuiltParquet) -> None:
+        _, table = built_parquet
         expected = {"model", *SCORE_COLUMNS, "date"}
         assert set(table.column_names) == expected
 
-    def test_schema_column_order(self) -> None:
+    def test_schema_column_order(self, built_parquet: BuiltParquet) -> None:
         """Verify columns are in the order expected by the leaderboard."""
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
+        _, table = built_parquet
         expected_order = ["model", *SCORE_COLUMNS, "date"]
         assert table.column_names == expected_order
 
-    def test_single_row(self) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
+    def test_single_row(self, built_parquet: BuiltParquet) -> None:
+        _, table = built_parquet
         assert table.num_rows == 1
 
-    def test_remote_path_format(self) -> None:
-        remote_path, _ = build_model_card_parquet(_make_preview())
+    def test_remote_path_format(self, built_parquet: BuiltParquet) -> None:
+        remote_path, _ = built_parquet
         assert remote_path == "model_cards/openai_gpt-4o.parquet"
 
-    def test_model_display_format(self) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
-        model_name = table.column("model").to_pylist()[0]
+    def test_model_display_format(self, built_parquet: BuiltParquet) -> None:
+        _, table = built_parquet
+        model_name = table.column("model")[0].as_py()
         assert model_name == "gpt-4o (Openai)"
 
-    def test_date_is_today_iso(self) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
-        parquet_date = table.column("date").to_pylist()[0]
+    def test_date_is_today_iso(self, built_parquet: BuiltParquet) -> None:
+        _, table = built_parquet
+        parquet_date = table.column("date")[0].as_py()
         assert parquet_date == date.today().isoformat()
 
 
-@pytest.mark.usefixtures("_mock_logs")
 class TestScoreConversion:
     """Verify 0-1 accuracy is converted to 0-100 percentage."""
 
@@ -227,12 +222,10 @@ class TestScoreConversion:
         ],
     )
     def test_teleqna_score_triplet(
-        self, column: str, index: int, expected: float
+        self, built_parquet: BuiltParquet, column: str, index: int, expected: float
     ) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
-        arr = table.column(column).to_pylist()[0]
+        _, table = built_parquet
+        arr = table.column(column)[0].as_py()
         assert arr[index] == pytest.approx(expected, abs=0.01)
 
     @pytest.mark.parametrize(
@@ -240,19 +233,17 @@ class TestScoreConversion:
         BENCHMARK_SCORE_PARAMS,
     )
     def test_all_benchmarks_scored(
-        self, column: str, expected_score: float
+        self, built_parquet: BuiltParquet, column: str, expected_score: float
     ) -> None:
-        _, parquet_bytes = build_model_card_parquet(_make_preview())
-
-        table = _read_parquet(parquet_bytes)
-        arr = table.column(column).to_pylist()[0]
+        _, table = built_parquet
+        arr = table.column(column)[0].as_py()
         assert arr[self.SCORE_INDEX] == expected_score
 
 
 class TestMissingStderr:
     """Verify stderr defaults to 0.0 when not present in metrics."""
 
-    def test_no_stderr_defaults_to_zero(self) -> None:
+    def test_no_stderr_defaults_to_zero(self, monkeypatch: pytest.MonkeyPatch) -> None:
         logs_no_stderr = {
             f"/fake/{PRIMARY_HF_COLUMN}.json": _EvalLog(
                 PRIMARY_BENCH_ID,
@@ -266,18 +257,18 @@ class TestMissingStderr:
 
         preview = _make_preview(log_files=[Path(f"/fake/{PRIMARY_HF_COLUMN}.json")])
 
-        with patch(MOCK_PATCH_TARGET, side_effect=mock_read):
-            _, parquet_bytes = build_model_card_parquet(preview)
+        monkeypatch.setattr(MOCK_PATCH_TARGET, mock_read)
+        _, parquet_bytes = build_model_card_parquet(preview)
 
         table = _read_parquet(parquet_bytes)
-        arr = table.column(PRIMARY_HF_COLUMN).to_pylist()[0]
+        arr = table.column(PRIMARY_HF_COLUMN)[0].as_py()
         assert arr[1] == 0.0
 
 
 class TestErrorCases:
     """Verify proper error handling for invalid inputs."""
 
-    def test_no_valid_logs_raises(self) -> None:
+    def test_no_valid_logs_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Logs with no eval data should raise ValueError."""
 
         class _BadLog:
@@ -290,10 +281,9 @@ class TestErrorCases:
 
         preview = _make_preview()
 
-        with (
-            patch(MOCK_PATCH_TARGET, side_effect=mock_read),
-            pytest.raises(ValueError, match="No valid benchmark scores"),
-        ):
+        monkeypatch.setattr(MOCK_PATCH_TARGET, mock_read)
+
+        with pytest.raises(ValueError, match="No valid benchmark scores"):
             build_model_card_parquet(preview)
 
     @pytest.mark.parametrize(
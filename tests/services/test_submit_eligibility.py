@@ -129,29 +129,28 @@ def _all_scores(value: float = 0.85) -> dict[str, float]:
     return {b_id: value for b_id in ALL_BENCH_IDS}
 
 
-def _all_sample_counts() -> dict[str, int]:
-    """Create sample counts at required sizes for all benchmarks."""
-    return {b.id: b.total_samples for b in BENCHMARKS}
+# Sample counts at required sizes for all benchmarks; read-only, copy to vary.
+ALL_SAMPLE_COUNTS: dict[str, int] = {b.id: b.total_samples for b in BENCHMARKS}
 
 
 class TestIsModelEligible:
     """Tests for model eligibility checking."""
 
     def test_eligible_with_all_benchmarks(self) -> None:
-        assert is_model_eligible("openai/gpt-4o", _all_scores(), _all_sample_counts())
+        assert is_model_eligible("openai/gpt-4o", _all_scores(), ALL_SAMPLE_COUNTS)
 
     def test_ineligible_missing_benchmark(self) -> None:
         scores = _all_scores()
         del scores[ALL_BENCH_IDS[0]]
-        assert not is_model_eligible("openai/gpt-4o", scores, _all_sample_counts())
+        assert not is_model_eligible("openai/gpt-4o", scores, ALL_SAMPLE_COUNTS)
 
     def test_ineligible_unrecognized_provider(self) -> None:
         with pytest.raises(ValueError, match="Unrecognized provider"):
-            is_model_eligible("fakeprovider/model", _all_scores(), _all_sample_counts())
+            is_model_eligible("fakeprovider/model", _all_scores(), ALL_SAMPLE_COUNTS)
 
     def test_ineligible_invalid_model_format(self) -> None:
         with pytest.raises(ValueError, match="Invalid model format"):
-            is_model_eligible("noSlash", _all_scores(), _all_sample_counts())
+            is_model_eligible("noSlash", _all_scores(), ALL_SAMPLE_COUNTS)
 
     def test_required_benchmark_ids_matches_registry(self) -> None:
         """REQUIRED_BENCHMARK_IDS stays in sync with the registry."""
@@ -204,7 +203,7 @@ class TestGetEligibleModels:
         manager = FakeJobManager(
             jobs=[job],
             results={"job_001": {"openai/gpt-4o": _all_scores()}},
-            sample_counts={"job_001": {"openai/gpt-4o": _all_sample_counts()}},
+            sample_counts={"job_001": {"openai/gpt-4o": ALL_SAMPLE_COUNTS}},
         )
         eligible = get_eligible_models(manager)
         assert len(eligible) == 1
@@ -249,12 +248,12 @@ class TestSampleCountEligibility:
         ("counts", "expected"),
         [
             pytest.param(
-                _all_sample_counts(),
+                ALL_SAMPLE_COUNTS,
                 True,
                 id="all_full_counts",
             ),
             pytest.param(
-                {**_all_sample_counts(), "teleqna": 999},
+                {**ALL_SAMPLE_COUNTS, "teleqna": 999},
                 False,
                 id="one_benchmark_short_by_one",
             ),
@@ -264,17 +263,17 @@ class TestSampleCountEligibility:
                 id="all_benchmarks_short",
             ),
             pytest.param(
-                {**_all_sample_counts(), "teleqna": 1000},
+                {**ALL_SAMPLE_COUNTS, "teleqna": 1000},
                 True,
                 id="exact_boundary_accepted",
             ),
             pytest.param(
-                {**_all_sample_counts(), "teleqna": 1001},
+                {**ALL_SAMPLE_COUNTS, "teleqna": 1001},
                 True,
                 id="above_required_accepted",
             ),
             pytest.param(
-                {**_all_sample_counts(), "teleqna": 0},
+                {**ALL_SAMPLE_COUNTS, "teleqna": 0},
                 False,
                 id="zero_samples_one_benchmark",
             ),